@@ -1,17 +1,19 @@
-from PyQt5.QtWidgets import QApplication
 import sys
 import logging
-import re
 import string
 from typing import Optional
 
 log = logging.getLogger('AVP.Main')
 
+# Strips unsafe punctuation characters such as \/?*&^%$# in one C-level pass
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
 
 def main() -> int:
     """Returns an exit code (0 for success)"""
     proj: Optional[str] = None  # Use Optional[str] because proj can be None
     mode: str = 'GUI'
+    app = None
 
     # Determine whether we're in GUI or commandline mode
     if len(sys.argv) > 2:
@@ -24,16 +26,17 @@ def main() -> int:
             if sys.argv[1].endswith('.avp'):
                 # remove file extension
                 sys.argv[1] = sys.argv[1][:-4]
-            sys.argv[1] = re.sub(f'[{re.escape(string.punctuation)}]', '', sys.argv[1])
+            sys.argv[1] = sys.argv[1].translate(_PUNCT_TABLE)
             # opening a project file with gui
             proj = sys.argv[1]
 
-    # Create Qt Application
-    app = QApplication(sys.argv)
-    app.setApplicationName("audio-visualizer")
-
     # Launch program
     if mode == 'commandline':
+        if not any(arg in sys.argv for arg in ('--test', '--help', '-h')):
+            # Export paths drive a video worker, which needs the Qt event loop
+            from PyQt5.QtWidgets import QApplication
+            app = QApplication(sys.argv)
+            app.setApplicationName("audio-visualizer")
         from .command import Command
 
         main_command = Command()  # Renamed to avoid shadowing the main function
@@ -43,12 +46,19 @@ def main() -> int:
     # Both branches here may occur in one execution:
     # Commandline parsing could change mode back to GUI
     if mode == 'GUI':
+        if app is None:
+            from PyQt5.QtWidgets import QApplication
+            app = QApplication(sys.argv)
+            app.setApplicationName("audio-visualizer")
         from .gui.mainwindow import MainWindow
 
         mainWindow = MainWindow(proj)
         log.debug("Finished creating MainWindow")
         mainWindow.raise_()
 
+    if app is None:
+        # Fast paths like --test exit before ever needing Qt
+        return 0
     return app.exec_()
 
 if __name__ == '__main__':
@@ -5,13 +5,16 @@
 '''
 from PyQt5 import QtCore
 import argparse
+import functools
 import os
+import re
 import sys
 import time
-import glob
 import signal
 import shutil
 import logging
+from collections import deque
+from itertools import islice
 from typing import List, Optional, Tuple, Dict, Any
 
 from . import core
@@ -24,6 +27,77 @@ class CommandError(Exception):
     pass
 
 
+# Interned parser strings: cached hashes for argparse's internal dict probes
+_DESCRIPTION = sys.intern('Create a visualization for an audio file')
+_EPILOG = sys.intern(
+    'EXAMPLE COMMAND:   avp myvideotemplate '
+    '-i ~/Music/song.mp3 -o ~/video.mp4 '
+    '-c 0 image path=~/Pictures/thisWeeksPicture.jpg '
+    '-c 1 video "preset=My Logo" -c 2 vis layout=classic'
+)
+_HELP_INPUT = sys.intern('input audio file')
+_HELP_OUTPUT = sys.intern('output video file')
+_HELP_EXPORT_PROJECT = sys.intern(
+    'use input and output files from project file if -i or -o is missing')
+_HELP_TEST = sys.intern(
+    'run tests and create a report full of debugging info')
+_HELP_DEBUG = sys.intern('create bigger logfiles while program is running')
+_HELP_PROJPATH = sys.intern('open a project file (.avp)')
+_HELP_COMP = sys.intern(
+    'first arg must be component NAME to insert at LAYER.'
+    '"help" for information about possible args for a component.')
+_HELP_NO_PREVIEW = sys.intern('disable live preview during export')
+
+
+@functools.lru_cache(maxsize=1)
+def _buildParser(prog: Optional[str]) -> argparse.ArgumentParser:
+    """Constructs the argument parser once; reused across parseArgs calls."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description=_DESCRIPTION,
+        epilog=_EPILOG
+    )
+
+    # input/output automatic-export commands
+    parser.add_argument(
+        '-i', '--input', metavar='SOUND',
+        help=_HELP_INPUT
+    )
+    parser.add_argument(
+        '-o', '--output', metavar='OUTPUT',
+        help=_HELP_OUTPUT
+    )
+    parser.add_argument(
+        '--export-project', action='store_true',
+        help=_HELP_EXPORT_PROJECT
+    )
+
+    # mutually exclusive debug options
+    debugCommands = parser.add_mutually_exclusive_group()
+    debugCommands.add_argument(
+        '--test', action='store_true',
+        help=_HELP_TEST
+    )
+    debugCommands.add_argument(
+        '--debug', action='store_true',
+        help=_HELP_DEBUG
+    )
+
+    # project/GUI options
+    parser.add_argument(
+        'projpath', metavar='path-to-project',
+        help=_HELP_PROJPATH, nargs='?')
+    parser.add_argument(
+        '-c', '--comp', metavar=('LAYER', 'ARG'),
+        help=_HELP_COMP,
+        nargs='*', action='append')
+    parser.add_argument(
+        '--no-preview', action='store_true',
+        help=_HELP_NO_PREVIEW
+    )
+    return parser
+
+
 class Command(QtCore.QObject):
     """
         This replaces the GUI MainWindow when in commandline mode.
@@ -39,11 +113,23 @@ class Command(QtCore.QObject):
         self.canceled: bool = False
         self.settings: QtCore.QSettings = core.Core.settings
         self.worker: Optional[Any] = None  # Replace Any with the actual type if possible
-        self.lastProgressUpdate: float = 0.0
+        self.lastProgressUpdate: int = 0  # time.monotonic_ns() timestamp
+        self._compFileNames: Optional[List[str]] = None
+        self._compNameCache: Dict[str, Optional[str]] = {}
+
+        self._buildNameIndices()
 
         # ctrl-c stops the export thread
         signal.signal(signal.SIGINT, self.stopVideo)
 
+    def _buildNameIndices(self) -> None:
+        """Builds O(1) lookup indices over the stable component-name lists."""
+        self._titleIndex = set(self.core.compNames)
+        self._fileIndex = {
+            fileName.lower(): self.core.compNames[i]
+            for i, fileName in enumerate(self.compFileNames)
+        }
+
     def _parse_component_args(self, comp_args: List[List[str]]) -> None:
         """Parses component arguments from the command line."""
         for comp in comp_args:
@@ -79,8 +165,8 @@ class Command(QtCore.QObject):
             projPath += '.avp'
 
         self.core.openProject(self, projPath)
-        # Reverse the order to match GUI behavior
-        self.core.selectedComponents = list(reversed(self.core.selectedComponents))
+        # Reverse the order to match GUI behavior (in place, no copy)
+        self.core.selectedComponents.reverse()
         self.core.componentListChanged()
 
     def _get_input_output_from_project(self, proj_path: str) -> Tuple[Optional[str], Optional[str]]:
@@ -101,55 +187,10 @@ class Command(QtCore.QObject):
         return input_, output
 
     def parseArgs(self) -> str:
-        parser = argparse.ArgumentParser(
-            prog='avp' if os.path.basename(sys.argv[0]) == "__main__.py" else None,
-            description='Create a visualization for an audio file',
-            epilog='EXAMPLE COMMAND:   avp myvideotemplate '
-                        '-i ~/Music/song.mp3 -o ~/video.mp4 '
-                        '-c 0 image path=~/Pictures/thisWeeksPicture.jpg '
-                        '-c 1 video "preset=My Logo" -c 2 vis layout=classic'
-        )
-
-        # input/output automatic-export commands
-        parser.add_argument(
-            '-i', '--input', metavar='SOUND',
-            help='input audio file'
-        )
-        parser.add_argument(
-            '-o', '--output', metavar='OUTPUT',
-            help='output video file'
-        )
-        parser.add_argument(
-            '--export-project', action='store_true',
-            help='use input and output files from project file if -i or -o is missing'
-        )
-
-        # mutually exclusive debug options
-        debugCommands = parser.add_mutually_exclusive_group()
-        debugCommands.add_argument(
-            '--test', action='store_true',
-            help='run tests and create a report full of debugging info'
-        )
-        debugCommands.add_argument(
-            '--debug', action='store_true',
-            help='create bigger logfiles while program is running'
+        parser = _buildParser(
+            'avp' if os.path.basename(sys.argv[0]) == "__main__.py" else None
         )
-
-        # project/GUI options
-        parser.add_argument(
-            'projpath', metavar='path-to-project',
-            help='open a project file (.avp)', nargs='?')
-        parser.add_argument(
-            '-c', '--comp', metavar=('LAYER', 'ARG'),
-            help='first arg must be component NAME to insert at LAYER.'
-            '"help" for information about possible args for a component.',
-            nargs='*', action='append')
-        parser.add_argument(
-            '--no-preview', action='store_true',
-            help='disable live preview during export'
-        )
-
-        args = parser.parse_args()
+        args = parser.parse_args(sys.argv[1:])
 
         if args.debug:
             core.FILE_LOGLVL = logging.DEBUG
@@ -190,8 +231,8 @@ class Command(QtCore.QObject):
 
         elif (args.projpath is None and
               'help' not in sys.argv and
-              '--debug' not in sys.argv and
-              '--test' not in sys.argv):
+              not args.debug and
+              not args.test):
             parser.print_help()
             raise CommandError("No action specified.") #Consistent error handling
 
@@ -202,15 +243,14 @@ class Command(QtCore.QObject):
             print("No components selected. Adding a default visualizer.")
             time.sleep(1)
             self.core.insertComponent(0, 0, self)
-        self.core.selectedComponents = list(
-            reversed(self.core.selectedComponents))
+        self.core.selectedComponents.reverse()
         self.core.componentListChanged()
         self.worker = self.core.newVideoWorker(
             self, input, output
         )
         # quit(0) after video is created
         self.worker.videoCreated.connect(self.videoCreated)
-        self.lastProgressUpdate = time.time()
+        self.lastProgressUpdate = time.monotonic_ns()
         self.worker.progressBarSetText.connect(self.progressBarSetText)
         self.createVideo.emit()
 
@@ -222,19 +262,20 @@ class Command(QtCore.QObject):
 
     @QtCore.pyqtSlot(str)
     def progressBarSetText(self, value: str) -> None:
-        if 'Export ' in value:
+        if value.startswith('Export '):
             # Don't duplicate completion/failure messages
             return
-        if not value.startswith('Exporting') \
-                and time.time() - self.lastProgressUpdate >= 0.05:
+        now = time.monotonic_ns()
+        delta = now - self.lastProgressUpdate
+        if not value.startswith('Exporting') and delta >= 50_000_000:
             # Show most messages very often
             print(value)
-        elif time.time() - self.lastProgressUpdate >= 2.0:
+        elif delta >= 2_000_000_000:
             # Give user time to read ffmpeg's output during the export
             print('##### %s' % value)
         else:
             return
-        self.lastProgressUpdate = time.time()
+        self.lastProgressUpdate = now
 
     @QtCore.pyqtSlot()
     def videoCreated(self) -> None:
@@ -255,24 +296,44 @@ class Command(QtCore.QObject):
     def drawPreview(self, *args: Any) -> None:
         pass
 
+    @property
+    def compFileNames(self) -> List[str]:
+        """Module filenames for each component, computed once on first use."""
+        if self._compFileNames is None:
+            self._compFileNames = [
+                os.path.splitext(
+                    os.path.basename(mod.__file__)
+                )[0]
+                for mod in self.core.modules
+            ]
+        return self._compFileNames
+
     def parseCompName(self, name: str) -> Optional[str]:
         '''Deduces a proper component name out of a commandline arg'''
+        if name in self._compNameCache:
+            return self._compNameCache[name]
+
+        realName = self._parseCompName(name)
+        self._compNameCache[name] = realName
+        return realName
 
-        if name.title() in self.core.compNames:
-            return name.title()
+    def _parseCompName(self, name: str) -> Optional[str]:
+        titled = name.title()
+        if titled in self._titleIndex:
+            return titled
+
+        # Substring matches can't be indexed; fall back to linear scans
         for compName in self.core.compNames:
             if name.capitalize() in compName:
                 return compName
 
-        compFileNames = [
-            os.path.splitext(
-                os.path.basename(mod.__file__)
-            )[0]
-            for mod in self.core.modules
-        ]
-        for i, compFileName in enumerate(compFileNames):
-            if name.lower() in compFileName:
-                return self.core.compNames[i]
+        lowered = name.lower()
+        exactFileMatch = self._fileIndex.get(lowered)
+        if exactFileMatch is not None:
+            return exactFileMatch
+        for fileName, compName in self._fileIndex.items():
+            if lowered in fileName:
+                return compName
         return None  # Indicate that no match was found
 
     def runTests(self) -> None:
@@ -281,22 +342,25 @@ class Command(QtCore.QObject):
         tests.run(test_report)
 
         # Choose a numbered location to put the output file
-        logNumber = 0
-        def getFilename() -> str:
+        def getFilename() -> Optional[str]:
             """Get a numbered filename for the final test report"""
-            nonlocal logNumber
-            name = os.path.join(os.path.expanduser('~'), "avp_test_report")
-            while True:
-                possibleName = f"{name}{logNumber:0>2}.txt"
-                if os.path.exists(possibleName) and logNumber < 100:
-                    logNumber += 1
-                    continue
-                break
-            return possibleName
+            home = os.path.expanduser('~')
+            pattern = re.compile(r'^avp_test_report(\d{2})\.txt$')
+            # One directory read instead of stat()ing candidates one by one
+            existing = []
+            with os.scandir(home) as it:
+                for entry in it:
+                    match = pattern.match(entry.name)
+                    if match:
+                        existing.append(int(match.group(1)))
+            logNumber = max(existing) + 1 if existing else 0
+            if logNumber >= 100:
+                return None
+            return os.path.join(home, f"avp_test_report{logNumber:0>2}.txt")
 
         # Copy latest debug log to chosen test report location
         filename = getFilename()
-        if logNumber == 100:
+        if filename is None:
             print("Test Report could not be created.")
             return
         try:
@@ -307,27 +371,35 @@ class Command(QtCore.QObject):
             with open(filename, "w") as f:
                 f.write(f"{'='*60} no debug log {'='*60}\n")
 
-        def concatenateLogs(logPattern: str) -> None:
+        def concatenateLogs() -> None:
             nonlocal filename
-            renderLogs = glob.glob(os.path.join(core.Core.logDir, logPattern))
+            # One directory pass instead of a globbed walk per pattern
+            buckets: Dict[str, List[str]] = {"render_": [], "preview_": []}
+            with os.scandir(core.Core.logDir) as it:
+                for entry in it:
+                    if not entry.is_file():
+                        continue
+                    for prefix in buckets:
+                        if entry.name.startswith(prefix) \
+                                and entry.name.endswith(".log"):
+                            buckets[prefix].append(entry.path)
+                            break
             with open(filename, "a") as fw:
-                for renderLog in renderLogs:
-                    with open(renderLog, "r") as fr:
-                        fw.write(f"{'='*60} {os.path.basename(renderLog)} {'='*60}\n")
-                        logContents = fr.readlines()
-                        fw.write("".join(logContents[:5]))
-                        fw.write("...trimmed...\n")
-                        fw.write("".join(logContents[-10:]))
-                        fw.write(f"{'='*60} {os.path.basename(renderLog)} {'='*60}\n")
-
-        concatenateLogs("render_*.log")
-        concatenateLogs("preview_*.log")
+                for renderLogs in buckets.values():
+                    for renderLog in sorted(renderLogs):
+                        with open(renderLog, "r") as fr:
+                            fw.write(f"{'='*60} {os.path.basename(renderLog)} {'='*60}\n")
+                            # Single forward pass: never hold the whole log in memory
+                            fw.writelines(islice(fr, 5))
+                            fw.write("...trimmed...\n")
+                            fw.writelines(deque(fr, maxlen=10))
+                            fw.write(f"{'='*60} {os.path.basename(renderLog)} {'='*60}\n")
+
+        concatenateLogs()
 
         # Append actual test report to debug log
-        with open(test_report, "r") as f:
-            output = f.readlines()
-        test_output = "".join(output)
-        print(test_output)
-        with open(filename, "a") as f:
-            f.write(test_output)
+        with open(test_report, "r") as fr, open(filename, "a") as fw:
+            shutil.copyfileobj(fr, fw)
+        with open(test_report, "r") as fr:
+            shutil.copyfileobj(fr, sys.stdout)
         print(f"Test Report created at {filename}")
\ No newline at end of file
@@ -9,6 +9,7 @@ import sys
 import math
 import time
 import logging
+import pprint
 from copy import copy
 from typing import List, Dict, Any, Tuple, Union, Callable, Optional, Type, TYPE_CHECKING
 
@@ -25,6 +26,12 @@ log = logging.getLogger('AVP.ComponentHandler')
 # Type alias for easier type hinting
 WidgetDict = Dict[str, List[QtWidgets.QWidget]]
 
+# Compiled .ui classes keyed by file path, so each XML file is parsed once
+_uiPageClasses: Dict[str, type] = {}
+
+# Sentinel for getattr() lookups that must distinguish "absent" from None
+_MISSING = object()
+
 class ComponentMetaclass(type(QtCore.QObject)):  # Inherit from type, and specify metaclass for QObject
     '''
         Checks the validity of each Component class and mutates some attrs.
@@ -36,28 +43,29 @@ class ComponentMetaclass(type(QtCore.QObject)):  # Inherit from type, and specif
             try:
                 return func(self, *args, **kwargs)
             except Exception:
-                try:
-                    raise ComponentError(self, 'initialization process')
-                except ComponentError:
-                    return
+                _reportComponentError(self, 'initialization process')
+                return
         return initializationWrapper
 
     def renderWrapper(func: Callable) -> Callable:
-        def renderWrapper(self: 'Component', *args: Any, **kwargs: Any) -> Any: # Added self and return
+        # Default args bind the globals once so each frame uses LOAD_FAST
+        def renderWrapper(self: 'Component', *args: Any,
+                          _log: Any = log, _BlankFrame: Any = BlankFrame,
+                          **kwargs: Any) -> Any: # Added self and return
             try:
-                log.verbose(
-                    '### %s #%s renders a preview frame ###',
-                    self.__class__.name, str(self.compPos),
-                )
+                if _log.isEnabledFor(logging.VERBOSE):
+                    _log.verbose(
+                        '### %s #%s renders a preview frame ###',
+                        self._className, self.compPos,
+                    )
                 return func(self, *args, **kwargs)
             except Exception as e:
-                try:
-                    if e.__class__.__name__.startswith('Component'):
+                if e.__class__.__name__.startswith('Component'):
+                    if not isinstance(e, ComponentError):
                         raise
-                    else:
-                        raise ComponentError(self, 'renderer')
-                except ComponentError:
-                    return BlankFrame()  # Return a blank frame on error
+                else:
+                    _reportComponentError(self, 'renderer')
+                return _BlankFrame()  # Return a blank frame on error
         return renderWrapper
 
     def commandWrapper(func: Callable) -> Callable:
@@ -90,10 +98,8 @@ class ComponentMetaclass(type(QtCore.QObject)):  # Inherit from type, and specif
                 try:
                     return func(self)
                 except Exception:
-                    try:
-                        raise ComponentError(self, 'properties')
-                    except ComponentError:
-                        return []  # Return empty list on error
+                    _reportComponentError(self, 'properties')
+                    return []  # Return empty list on error
         return propertiesWrapper
 
     def errorWrapper(func: Callable) -> Callable:
@@ -107,25 +113,15 @@ class ComponentMetaclass(type(QtCore.QObject)):  # Inherit from type, and specif
 
     def loadPresetWrapper(func: Callable) -> Callable:
         '''Wraps loadPreset to handle the self.openingPreset boolean'''
-        class openingPreset:  # Inner class for context manager
-            def __init__(self, comp: 'Component') -> None:
-                self.comp = comp
-
-            def __enter__(self) -> None:
-                self.comp.openingPreset = True
-
-            def __exit__(self, *args: Any) -> None:
-                self.comp.openingPreset = False
-
         def presetWrapper(self: 'Component', *args: Any) -> Any: # Added self
-            with openingPreset(self):
-                try:
-                    return func(self, *args)
-                except Exception:
-                    try:
-                        raise ComponentError(self, 'preset loader')
-                    except ComponentError:
-                        return
+            self.openingPreset = True
+            try:
+                return func(self, *args)
+            except Exception:
+                _reportComponentError(self, 'preset loader')
+                return
+            finally:
+                self.openingPreset = False
         return presetWrapper
 
     def updateWrapper(func: Callable) -> Callable:
@@ -134,63 +130,57 @@ class ComponentMetaclass(type(QtCore.QObject)):  # Inherit from type, and specif
             Afterwards, for non-user updates, calls _autoUpdate().
             For undoable updates triggered by the user, calls _userUpdate()
         '''
-        class wrap: # Inner class for context manager
-            def __init__(self, comp: 'Component', auto: bool) -> None:
-                self.comp = comp
-                self.auto = auto
-
-            def __enter__(self) -> None:
-                self.comp._preUpdate()
-
-            def __exit__(self, *args: Any) -> None:
-                if self.auto or self.comp.openingPreset \
-                        or not hasattr(self.comp.parent, 'undoStack'):
+        def updateWrapper(self: 'Component', **kwargs: Any) -> Any: # Added self
+            auto = kwargs.get('auto', False)  # Use .get() for optional kwargs
+            self._preUpdate()
+            try:
+                return func(self)
+            except Exception:
+                _reportComponentError(self, 'update method')
+                return
+            finally:
+                if auto or self.openingPreset \
+                        or not hasattr(self.parent, 'undoStack'):
                     log.verbose('Automatic update')
-                    self.comp._autoUpdate()
+                    self._autoUpdate()
                 else:
                     log.verbose('User update')
-                    self.comp._userUpdate()
-
-        def updateWrapper(self: 'Component', **kwargs: Any) -> Any: # Added self
-            auto = kwargs.get('auto', False)  # Use .get() for optional kwargs
-            with wrap(self, auto):
-                try:
-                    return func(self)
-                except Exception:
-                    try:
-                        raise ComponentError(self, 'update method')
-                    except ComponentError:
-                        return
+                    self._userUpdate()
         return updateWrapper
 
     def widgetWrapper(func: Callable) -> Callable:
         '''Connects all widgets to update method after the subclass's method'''
-        class wrap:  # Inner class for context manager
-            def __init__(self, comp: 'Component') -> None:
-                self.comp = comp
-
-            def __enter__(self) -> None:
-                pass
-
-            def __exit__(self, *args: Any) -> None:
-                for widgetList in self.comp._allWidgets.values():
-                    for widget in widgetList:
-                        log.verbose('Connecting %s', str(
-                            widget.__class__.__name__))
-                        connectWidget(widget, self.comp.update)
-
         def widgetWrapper(self: 'Component', *args: Any, **kwargs: Any) -> Any: # Added self
-            auto = kwargs.get('auto', False)
-            with wrap(self):
-                try:
-                    return func(self, *args, **kwargs)
-                except Exception:
-                    try:
-                        raise ComponentError(self, 'widget creation')
-                    except ComponentError:
-                        return
+            try:
+                return func(self, *args, **kwargs)
+            except Exception:
+                _reportComponentError(self, 'widget creation')
+                return
+            finally:
+                verboseEnabled = log.isEnabledFor(logging.VERBOSE)
+                for widgetList in self._allWidgets.values():
+                    for widget in widgetList:
+                        if verboseEnabled:
+                            log.verbose(
+                                'Connecting %s', widget.__class__.__name__)
+                        connectWidget(widget, self.update)
         return widgetWrapper
 
+    # Dispatch table mapping decoratable attrs to their wrapper,
+    # built once at import time instead of an if/elif chain per subclass
+    _decoratorTable: Dict[str, Callable] = {
+        'names': classmethod,               # Class methods
+        'audio': property,                  # Properties
+        'error': errorWrapper,
+        'properties': propertiesWrapper,
+        'preFrameRender': initializationWrapper,
+        'previewRender': renderWrapper,
+        'loadPreset': loadPresetWrapper,
+        'command': commandWrapper,
+        'update': updateWrapper,
+        'widget': widgetWrapper,
+    }
+
     def __new__(cls, name: str, parents: Tuple[type, ...], attrs: Dict[str, Any]) -> Any: # Added return
         if 'ui' not in attrs:
             # Use module name as ui filename by default
@@ -198,38 +188,13 @@ class ComponentMetaclass(type(QtCore.QObject)):  # Inherit from type, and specif
                     attrs['__module__'].split('.')[-1]
                 )[0]
 
-        decorate = (
-            'names',                            # Class methods
-            'error', 'audio', 'properties',     # Properties
-            'preFrameRender', 'previewRender',
-            'loadPreset', 'command',
-            'update', 'widget',
-        )
-
         # Auto-decorate methods
-        for key in decorate:
+        for key, wrapper in cls._decoratorTable.items():
             if key not in attrs:
                 continue
-            if key in ('names'):
-                attrs[key] = classmethod(attrs[key])
-            elif key in ('audio'):
-                attrs[key] = property(attrs[key])
-            elif key == 'command':
-                attrs[key] = cls.commandWrapper(attrs[key])
-            elif key == 'previewRender':
-                attrs[key] = cls.renderWrapper(attrs[key])
-            elif key == 'preFrameRender':
-                attrs[key] = cls.initializationWrapper(attrs[key])
-            elif key == 'properties':
-                attrs[key] = cls.propertiesWrapper(attrs[key])
-            elif key == 'error':
-                attrs[key] = cls.errorWrapper(attrs[key])
-            elif key == 'loadPreset':
-                attrs[key] = cls.loadPresetWrapper(attrs[key])
-            elif key == 'update':
-                attrs[key] = cls.updateWrapper(attrs[key])
-            elif key == 'widget' and parents[0] != QtCore.QObject:
-                attrs[key] = cls.widgetWrapper(attrs[key])
+            if key == 'widget' and parents[0] == QtCore.QObject:
+                continue
+            attrs[key] = wrapper(attrs[key])
 
         # Turn version string into a number
         try:
@@ -260,6 +225,23 @@ class Component(QtCore.QObject, metaclass=ComponentMetaclass):
     name: str = 'Component'
     # ui = 'name_Of_Non_Default_Ui_File'
 
+    # Slot storage for every attr the base class assigns: cheaper
+    # attribute access and no per-instance __dict__ at this level.
+    # Subclasses without their own __slots__ still get a __dict__
+    # for their component-specific attributes.
+    __slots__ = (
+        'moduleIndex', 'compPos', 'core', 'currentPreset', '_className',
+        '_allWidgets', '_trackedWidgets', '_presetNames', '_commandArgs',
+        '_colorWidgets', '_colorFuncs', '_colorStyleCache',
+        '_relativeWidgets',
+        '_relativeValues', '_relativeMaximums', '_verticalAttrs',
+        '_horizRelative', '_vertRelative',
+        'openingPreset', 'mergeUndo', '_dirty',
+        '_lockedProperties', '_lockedError', '_lockedSize', '_cachedSize',
+        'oldAttrs', 'canceled',
+        'parent', 'settings', 'page',
+    )
+
     version: str = '1.0.0'
     # The major version (before the first dot) is used to determine
     # preset compatibility; the rest is ignored so it can be non-numeric.
@@ -272,6 +254,8 @@ class Component(QtCore.QObject, metaclass=ComponentMetaclass):
         self.moduleIndex: int = moduleIndex
         self.compPos: int = compPos
         self.core: 'Core' = core # Added type hint
+        # Cached so hot paths skip the type-dict lookup chain
+        self._className: str = type(self).name
 
         # STATUS VARIABLES
         self.currentPreset: Optional[str] = None
@@ -281,28 +265,39 @@ class Component(QtCore.QObject, metaclass=ComponentMetaclass):
         self._commandArgs: Dict[str, Optional[str]] = {}
         self._colorWidgets: Dict[str, QtWidgets.QPushButton] = {}
         self._colorFuncs: Dict[str, Callable[[], None]] = {}
+        # Button stylesheets memoized by RGB tuple
+        self._colorStyleCache: Dict[Tuple[int, int, int], str] = {}
         self._relativeWidgets: Dict[str, QtWidgets.QWidget] = {}
         # Pixel values stored as floats
         self._relativeValues: Dict[str, float] = {}
         # Maximum values of spinBoxes at 1080p (Core.resolutions[0])
         self._relativeMaximums: Dict[str, int] = {}
+        # Relative attrs which scale with the vertical axis
+        self._verticalAttrs: frozenset = frozenset()
+        # (attr, widget) pairs bucketed by axis for _preUpdate, so the
+        # per-update loop never touches the widget dict
+        self._horizRelative: List[Tuple[str, QtWidgets.QWidget]] = []
+        self._vertRelative: List[Tuple[str, QtWidgets.QWidget]] = []
 
         # LOCKING VARIABLES
         self.openingPreset: bool = False
         self.mergeUndo: bool = True
+        # True when setAttrs stored a value that differs from the old one
+        self._dirty: bool = False
         self._lockedProperties: Optional[List[str]] = None
         self._lockedError: Optional[Union[str, Tuple[str, str]]] = None
         self._lockedSize: Optional[Tuple[int, int]] = None
+        # Output size read from QSettings, cached until invalidateSize()
+        self._cachedSize: Optional[Tuple[int, int]] = None
         # If set to a dict, values are used as basis to update relative widgets
         self.oldAttrs: Optional[Dict[str, Any]] = None
         # Stop lengthy processes in response to this variable
         self.canceled: bool = False
 
     def __str__(self) -> str:
-        return self.__class__.name
+        return self._className
 
     def __repr__(self) -> str:
-        import pprint
         try:
             preset = self.savePreset()
         except Exception as e:
@@ -396,20 +391,31 @@ class Component(QtCore.QObject, metaclass=ComponentMetaclass):
         self.settings = parent.settings
         log.verbose(
             'Creating UI for %s #%s\'s widget',
-            self.__class__.name, self.compPos
+            self._className, self.compPos
         )
         self.page = self.loadUi(self.__class__.ui)
 
         # Find all normal widgets which will be connected after subclass method
+        # One walk over the widget tree instead of one findChildren per type
         self._allWidgets = {
-            'lineEdit': self.page.findChildren(QtWidgets.QLineEdit),
-            'checkBox': self.page.findChildren(QtWidgets.QCheckBox),
-            'spinBox': self.page.findChildren(QtWidgets.QSpinBox),
-            'comboBox': self.page.findChildren(QtWidgets.QComboBox),
+            'lineEdit': [],
+            'checkBox': [],
+            'spinBox': [],
+            'comboBox': [],
         }
-        self._allWidgets['spinBox'].extend(
-            self.page.findChildren(QtWidgets.QDoubleSpinBox)
-        )
+        # isinstance, not an exact-type lookup: promoted widgets like
+        # QFontComboBox must land in their base class's bucket
+        for child in self.page.findChildren(QtWidgets.QWidget):
+            if isinstance(child, QtWidgets.QLineEdit):
+                self._allWidgets['lineEdit'].append(child)
+            elif isinstance(child, QtWidgets.QCheckBox):
+                self._allWidgets['checkBox'].append(child)
+            elif isinstance(
+                    child,
+                    (QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox)):
+                self._allWidgets['spinBox'].append(child)
+            elif isinstance(child, QtWidgets.QComboBox):
+                self._allWidgets['comboBox'].append(child)
 
     def update(self) -> None:
         '''
@@ -441,11 +447,8 @@ class Component(QtCore.QObject, metaclass=ComponentMetaclass):
 
             if attr in self._colorWidgets:
                 widget.setText('%s,%s,%s' % val)
-                btnStyle = (
-                    "QPushButton { background-color : %s; outline: none; }"
-                    % QColor(*val).name()
-                )
-                self._colorWidgets[attr].setStyleSheet(btnStyle)
+                self._colorWidgets[attr].setStyleSheet(
+                    self._styleFor(tuple(val)))
             elif attr in self._relativeWidgets:
                 self._relativeValues[attr] = val
                 pixelVal = self.pixelValForAttr(attr, val)
@@ -455,20 +458,19 @@ class Component(QtCore.QObject, metaclass=ComponentMetaclass):
 
     def savePreset(self) -> Dict[str, Any]:
         saveValueStore: Dict[str, Any] = {}
-        for attr, widget in self._trackedWidgets.items():
-            presetAttrName = (
-                attr if attr not in self._presetNames
-                else self._presetNames[attr]
-            )
-            if attr in self._relativeWidgets:
+        presetNameFor = self._presetNames.get
+        relativeWidgets = self._relativeWidgets
+        relativeValues = self._relativeValues
+        for attr in self._trackedWidgets:
+            if attr in relativeWidgets:
                 try:
-                    val: Union[str, Tuple[int, int, int], float, int, bool] = self._relativeValues[attr]
+                    val: Union[str, Tuple[int, int, int], float, int, bool] = relativeValues[attr]
                 except AttributeError:
                     val = self.floatValForAttr(attr)
             else:
                 val = getattr(self, attr)
 
-            saveValueStore[presetAttrName] = val
+            saveValueStore[presetNameFor(attr, attr)] = val
         return saveValueStore
 
     def commandHelp(self) -> None:
@@ -495,25 +497,34 @@ class Component(QtCore.QObject, metaclass=ComponentMetaclass):
     # =~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~=~==~=~=~=~=~=~=~=~=~=~=~=~=~=~
     def _preUpdate(self) -> None:
         '''Happens before subclass update()'''
-        for attr in self._relativeWidgets:
-            self.updateRelativeWidget(attr)
+        if not self._relativeWidgets:
+            return
+        # Read each axis once and pass it down rather than re-resolving
+        # verticality and the output size for every widget
+        width = self.width
+        height = self.height
+        for attr, widget in self._horizRelative:
+            self.updateRelativeWidget(attr, width, widget)
+        for attr, widget in self._vertRelative:
+            self.updateRelativeWidget(attr, height, widget)
 
     def _userUpdate(self) -> None:
         '''Happens after subclass update() for an undoable update by user.'''
-        oldWidgetVals: Dict[str, Any] = {
-            attr: copy(getattr(self, attr))
-            for attr in self._trackedWidgets
-        }
-        newWidgetVals: Dict[str, Any] = {
-            attr: getWidgetValue(widget)
-            if attr not in self._colorWidgets else rgbFromString(widget.text())
-            for attr, widget in self._trackedWidgets.items()
-        }
-        modifiedWidgets: Dict[str, Any] = {
-            attr: val
-            for attr, val in newWidgetVals.items()
-            if val != oldWidgetVals[attr]
-        }
+        # One pass over the tracked widgets builds all three dicts;
+        # globals bound to locals to keep the loop on LOAD_FAST
+        _copy = copy
+        _rgb = rgbFromString
+        _getVal = getWidgetValue
+        colorWidgets = self._colorWidgets
+        oldWidgetVals: Dict[str, Any] = {}
+        modifiedWidgets: Dict[str, Any] = {}
+        for attr, widget in self._trackedWidgets.items():
+            oldVal = _copy(getattr(self, attr))
+            newVal = _rgb(widget.text()) \
+                if attr in colorWidgets else _getVal(widget)
+            oldWidgetVals[attr] = oldVal
+            if newVal != oldVal:
+                modifiedWidgets[attr] = newVal
         if modifiedWidgets:
             action = ComponentUpdate(self, oldWidgetVals, modifiedWidgets)
             if hasattr(self.parent, 'undoStack'):
@@ -523,8 +534,9 @@ class Component(QtCore.QObject, metaclass=ComponentMetaclass):
 
     def _autoUpdate(self) -> None:
         '''Happens after subclass update() for an internal component update.'''
+        getVal = getWidgetValue
         newWidgetVals: Dict[str, Any] = {
-            attr: getWidgetValue(widget)
+            attr: getVal(widget)
             for attr, widget in self._trackedWidgets.items()
         }
         self.setAttrs(newWidgetVals)
@@ -535,46 +547,77 @@ class Component(QtCore.QObject, metaclass=ComponentMetaclass):
             Sets attrs (linked to trackedWidgets) in this component to
             the values in the attrDict. Mutates certain widget values if needed
         '''
+        sentinel = object()
         for attr, val in attrDict.items():
             if attr in self._colorWidgets:
                 # Color Widgets must have a tuple & have a button to update
-                if type(val) is tuple:
-                    rgbTuple = val
-                else:
-                    rgbTuple = rgbFromString(val)
-                btnStyle = (
-                    "QPushButton { background-color : %s; outline: none; }"
-                    % QColor(*rgbTuple).name())
-                self._colorWidgets[attr].setStyleSheet(btnStyle)
-                setattr(self, attr, rgbTuple)
+                rgbTuple = val if isinstance(val, tuple) \
+                    else rgbFromString(val)
+                if rgbTuple != getattr(self, attr, None):
+                    # setStyleSheet is the expensive call here; skip it
+                    # when the stored value is already correct
+                    self._colorWidgets[attr].setStyleSheet(
+                        self._styleFor(rgbTuple))
+                    setattr(self, attr, rgbTuple)
+                    self._dirty = True
 
             else:
                 # Normal tracked widget
-                setattr(self, attr, val)
-            log.verbose('Setting %s self.%s to %s' % (
-                self.__class__.name, attr, val))
+                if getattr(self, attr, sentinel) != val:
+                    setattr(self, attr, val)
+                    self._dirty = True
+            log.verbose(
+                'Setting %s self.%s to %s', self._className, attr, val)
+
+    def _styleFor(self, rgbTuple: Tuple[int, int, int]) -> str:
+        '''Memoized pushbutton stylesheet for an RGB tuple'''
+        style = self._colorStyleCache.get(rgbTuple)
+        if style is None:
+            style = (
+                "QPushButton { background-color : %s; outline: none; }"
+                % QColor(*rgbTuple).name()
+            )
+            self._colorStyleCache[rgbTuple] = style
+        return style
 
     def setWidgetValues(self, attrDict: Dict[str, Any]) -> None:
         '''
             Sets widgets defined by keys in trackedWidgets in this preset to
             the values in the attrDict.
         '''
-        affectedWidgets = [
-            self._trackedWidgets[attr] for attr in attrDict
+        # Resolve each widget once; reuse the list for signal blocking
+        items = [
+            (attr, self._trackedWidgets[attr], val)
+            for attr, val in attrDict.items()
         ]
-        with blockSignals(affectedWidgets):
-            for attr, val in attrDict.items():
-                widget = self._trackedWidgets[attr]
-                if attr in self._colorWidgets:
+        colorWidgets = self._colorWidgets
+        setVal = setWidgetValue
+        with blockSignals([widget for _, widget, _ in items]):
+            for attr, widget, val in items:
+                if attr in colorWidgets:
                     val = '%s,%s,%s' % val
-                setWidgetValue(widget, val)
+                setVal(widget, val)
 
     def _sendUpdateSignal(self) -> None:
-        if not self.core.openingProject:
-            self.parent.drawPreview()
-            saveValueStore = self.savePreset()
-            saveValueStore['preset'] = self.currentPreset
-            self.modified.emit(self.compPos, saveValueStore)
+        # Nothing actually changed since the last emit: skip the preview
+        # repaint and preset re-serialization entirely
+        if not self._dirty or self.core.openingProject:
+            return
+        self._dirty = False
+        self.parent.drawPreview()
+        saveValueStore = self.savePreset()
+        saveValueStore['preset'] = self.currentPreset
+        self.modified.emit(self.compPos, saveValueStore)
+
+    def _forceUpdateSignal(self, *_args: Any) -> None:
+        '''
+            For state changes that bypass the tracked widgets (direct
+            grid edits, Qt signals wired straight here): mark the
+            component dirty so _sendUpdateSignal cannot skip the emit.
+            Extra args from connected Qt signals are ignored.
+        '''
+        self._dirty = True
+        self._sendUpdateSignal()
 
     def trackWidgets(self, trackDict: Dict[str, QtWidgets.QWidget], **kwargs: Any) -> None:
         '''
@@ -591,18 +634,16 @@ class Component(QtCore.QObject, metaclass=ComponentMetaclass):
         '''
         self._trackedWidgets = trackDict
         for kwarg in kwargs:
-            try:
-                if kwarg in (
-                        'presetNames',
-                        'commandArgs',
-                        'colorWidgets',
-                        'relativeWidgets',
-                        ):
-                    setattr(self, '_{}'.format(kwarg), kwargs[kwarg])
-                else:
-                    raise ComponentError(
-                        self, 'Nonsensical keywords to trackWidgets.')
-            except ComponentError:
+            if kwarg in (
+                    'presetNames',
+                    'commandArgs',
+                    'colorWidgets',
+                    'relativeWidgets',
+                    ):
+                setattr(self, '_{}'.format(kwarg), kwargs[kwarg])
+            else:
+                _reportComponentError(
+                    self, 'Nonsensical keywords to trackWidgets.')
                 continue
 
             if kwarg == 'colorWidgets':
@@ -626,6 +667,22 @@ class Component(QtCore.QObject, metaclass=ComponentMetaclass):
                     )
 
             if kwarg == 'relativeWidgets':
+                # classify axes once so the axis decorator avoids string scans
+                self._verticalAttrs = frozenset(
+                    attr for attr in kwargs[kwarg]
+                    if 'height' in attr.lower()
+                    or 'ypos' in attr.lower()
+                    or attr == 'y'
+                )
+                trackedWidgets = self._trackedWidgets
+                self._vertRelative = [
+                    (attr, trackedWidgets[attr]) for attr in kwargs[kwarg]
+                    if attr in self._verticalAttrs
+                ]
+                self._horizRelative = [
+                    (attr, trackedWidgets[attr]) for attr in kwargs[kwarg]
+                    if attr not in self._verticalAttrs
+                ]
                 # store maximum values of spinBoxes to be scaled appropriately
                 for attr in kwargs[kwarg]:
                     self._relativeMaximums[attr] = \
@@ -671,22 +728,48 @@ class Component(QtCore.QObject, metaclass=ComponentMetaclass):
 
     def loadUi(self, filename: str) -> QtWidgets.QWidget:
         '''Load a Qt Designer ui file to use for this component's widget'''
-        return uic.loadUi(os.path.join(self.core.componentsPath, filename))
+        path = os.path.join(self.core.componentsPath, filename)
+        pageClass = _uiPageClasses.get(path)
+        if pageClass is None:
+            # Parse the XML once and compile it into a reusable widget class
+            formClass, baseClass = uic.loadUiType(path)
+
+            class pageClass(baseClass, formClass):  # type: ignore
+                def __init__(self) -> None:
+                    super().__init__()
+                    self.setupUi(self)
+
+            _uiPageClasses[path] = pageClass
+        return pageClass()
 
     @property
     def width(self) -> int:
         if self._lockedSize is None:
-            return int(self.settings.value('outputWidth'))
+            if self._cachedSize is None:
+                self._cacheSize()
+            return self._cachedSize[0]  # type: ignore
         else:
             return self._lockedSize[0]
 
     @property
     def height(self) -> int:
         if self._lockedSize is None:
-            return int(self.settings.value('outputHeight'))
+            if self._cachedSize is None:
+                self._cacheSize()
+            return self._cachedSize[1]  # type: ignore
         else:
             return self._lockedSize[1]
 
+    def _cacheSize(self) -> None:
+        self._cachedSize = (
+            int(self.settings.value('outputWidth')),
+            int(self.settings.value('outputHeight')),
+        )
+
+    def invalidateSize(self) -> None:
+        '''Forget the cached output size after the resolution setting changes'''
+        self._cachedSize = None
+
     def cancel(self) -> None:
         '''Stop any lengthy process in response to this variable.'''
         self.canceled = True
@@ -697,22 +780,13 @@ class Component(QtCore.QObject, metaclass=ComponentMetaclass):
         self.unlockError()
     def relativeWidgetAxis(func: Callable) -> Callable:
         def relativeWidgetAxis(self: 'Component', attr: str, *args: Any, **kwargs: Any) -> Any:
-            hasVerticalWords = (
-                lambda attr:
-                'height' in attr.lower() or
-                'ypos' in attr.lower() or
-                attr == 'y'
-            )
+            # Verticality was classified once in trackWidgets()
+            vertical = attr in self._verticalAttrs
             if 'axis' not in kwargs:
-                axis = self.width
-                if hasVerticalWords(attr):
-                    axis = self.height
-                kwargs['axis'] = axis
-            if 'axis' in kwargs and type(kwargs['axis']) is tuple:
-                axis = kwargs['axis'][0]
-                if hasVerticalWords(attr):
-                    axis = kwargs['axis'][1]
-                kwargs['axis'] = axis
+                kwargs['axis'] = self.height if vertical else self.width
+            elif type(kwargs['axis']) is tuple:
+                kwargs['axis'] = \
+                    kwargs['axis'][1] if vertical else kwargs['axis'][0]
             return func(self, attr, *args, **kwargs)
         return relativeWidgetAxis
 
@@ -723,7 +797,7 @@ class Component(QtCore.QObject, metaclass=ComponentMetaclass):
         if val > 50.0:
             log.warning(
                 '%s #%s attempted to set %s to dangerously high number %s',
-                self.__class__.name, self.compPos, attr, val
+                self._className, self.compPos, attr, val
             )
             val = 50.0
         result = math.ceil(kwargs['axis'] * val)
@@ -741,9 +815,15 @@ class Component(QtCore.QObject, metaclass=ComponentMetaclass):
 
     def setRelativeWidget(self, attr: str, floatVal: float) -> None:
         '''Set a relative widget using a float'''
+        widget = self._trackedWidgets[attr]
         pixelVal = self.pixelValForAttr(attr, floatVal)
-        with blockSignals([self._trackedWidgets[attr]]):
-            self._trackedWidgets[attr].setValue(pixelVal)
+        # Single widget: block directly rather than paying for the
+        # list + context-manager of the blockSignals() helper
+        widget.blockSignals(True)
+        try:
+            widget.setValue(pixelVal)
+        finally:
+            widget.blockSignals(False)
         self.update(auto=True)
 
     def getOldAttr(self, attr: str) -> Any:
@@ -752,46 +832,110 @@ class Component(QtCore.QObject, metaclass=ComponentMetaclass):
             a relative widget must be updated. Required because undoing/redoing
             can make determining the 'previous' value tricky.
         '''
-        if self.oldAttrs is not None:
-            return self.oldAttrs[attr]
-        else:
-            try:
-                return getattr(self, attr)
-            except AttributeError:
-                log.error('Using visible values instead of oldAttrs')
-                return self._trackedWidgets[attr].value()
-
-    def updateRelativeWidget(self, attr: str) -> None:
+        oldAttrs = self.oldAttrs
+        if oldAttrs is not None:
+            return oldAttrs[attr]
+        val = getattr(self, attr, _MISSING)
+        if val is _MISSING:
+            log.error('Using visible values instead of oldAttrs')
+            return self._trackedWidgets[attr].value()
+        return val
+
+    def updateRelativeWidget(
+            self, attr: str, axis: Optional[int] = None,
+            widget: Optional[QtWidgets.QWidget] = None) -> None:
         '''Called by _preUpdate() for each relativeWidget before each update'''
+        if axis is None:
+            axis = self.height if attr in self._verticalAttrs else self.width
+        if widget is None:
+            widget = self._trackedWidgets[attr]
+        # Resolve the value dict once for the whole update
+        relativeValues = self._relativeValues
         oldUserValue = self.getOldAttr(attr)
-        newUserValue = self._trackedWidgets[attr].value()
-        newRelativeVal = self.floatValForAttr(attr, newUserValue)
+        newUserValue = widget.value()
+        newRelativeVal = self.floatValForAttr(attr, newUserValue, axis=axis)
 
-        if attr in self._relativeValues:
-            oldRelativeVal = self._relativeValues[attr]
+        if attr in relativeValues:
+            oldRelativeVal = relativeValues[attr]
             if oldUserValue == newUserValue \
                     and oldRelativeVal != newRelativeVal:
                 # Float changed without pixel value changing, which
                 # means the pixel value needs to be updated
-                log.debug(
-                    'Updating %s #%s\'s relative widget: %s',
-                    self.__class__.name, self.compPos, attr)
-                with blockSignals([self._trackedWidgets[attr]]):
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(
+                        'Updating %s #%s\'s relative widget: %s',
+                        self._className, self.compPos, attr)
+                widget.blockSignals(True)
+                try:
                     self.updateRelativeWidgetMaximum(attr)
-                    pixelVal = self.pixelValForAttr(attr, oldRelativeVal)
-                    self._trackedWidgets[attr].setValue(pixelVal)
+                    pixelVal = self.pixelValForAttr(
+                        attr, oldRelativeVal, axis=axis)
+                    widget.setValue(pixelVal)
+                finally:
+                    widget.blockSignals(False)
 
-        if attr not in self._relativeValues \
+        if attr not in relativeValues \
                 or oldUserValue != newUserValue:
-            self._relativeValues[attr] = newRelativeVal
+            relativeValues[attr] = newRelativeVal
 
     def updateRelativeWidgetMaximum(self, attr: str) -> None:
-        maxRes = int(self.core.resolutions[0].split('x')[0])
+        maxRes = self.core.parsedResolutions[0][0]
         newMaximumValue = self.width * (
             self._relativeMaximums[attr] /
             maxRes
         )
-        self._trackedWidgets[attr].setMaximum(int(newMaximumValue))
+        widget = self._trackedWidgets[attr]
+        widget.setMaximum(int(newMaximumValue))
+
+
+def _reportComponentError(caller: Component, name: str, msg: Optional[str] = None) -> Optional[str]:
+    '''
+        Logs a component failure and emits the error signal without the
+        cost of raising/catching an exception. Returns the message shown
+        to the user, or None when a quickly-repeated message is dropped.
+    '''
+    excType, excValue, excTb = sys.exc_info()
+    if msg is None and excType is not None:
+        msg = str(excValue)
+    else:
+        msg = 'Unknown error.'
+    log.error("ComponentError by %s's %s: %s" % (
+        caller.name, name, msg))
+
+    # Don't create multiple windows for quickly repeated messages
+    if len(ComponentError.prevErrors) > 1:
+        ComponentError.prevErrors.pop()
+    ComponentError.prevErrors.insert(0, name)
+    curTime = time.time()
+    if name in ComponentError.prevErrors[1:] \
+            and curTime - ComponentError.lastTime < 1.0:
+        return None
+    ComponentError.lastTime = time.time()
+
+    from .toolkit import formatTraceback
+    if excType is not None:
+        string = (
+            "%s component (#%s): %s encountered %s %s: %s" % (
+                caller._className,
+                str(caller.compPos),
+                name,
+                'an' if excType.__name__[:1] in 'AIUOE' else 'a',
+                excType.__name__,
+                str(excValue)
+            )
+        )
+        detail = formatTraceback(excTb)
+    else:
+        string = name
+        detail = "Attributes:\n%s" % (
+            "\n".join(
+                [m for m in dir(caller) if not m.startswith('_')]
+            )
+        )
+
+    caller.lockError(string)
+    caller._error.emit(string, detail)
+    return string
 
 
 class ComponentError(RuntimeError):
@@ -801,50 +945,17 @@ class ComponentError(RuntimeError):
     lastTime: float = time.time()
 
     def __init__(self, caller: Component, name: str, msg: Optional[str] = None) -> None:
-        if msg is None and sys.exc_info()[0] is not None:
-            msg = str(sys.exc_info()[1])  # type: ignore
-        else:
-            msg = 'Unknown error.'
-        log.error("ComponentError by %s's %s: %s" % (
-            caller.name, name, msg))
-
-        # Don't create multiple windows for quickly repeated messages
-        if len(ComponentError.prevErrors) > 1:
-            ComponentError.prevErrors.pop()
-        ComponentError.prevErrors.insert(0, name)
-        curTime = time.time()
-        if name in ComponentError.prevErrors[1:] \
-                and curTime - ComponentError.lastTime < 1.0:
-            return
-        ComponentError.lastTime = time.time()
-
-        from .toolkit import formatTraceback
-        if sys.exc_info()[0] is not None:
-            string = (
-                "%s component (#%s): %s encountered %s %s: %s" % (
-                    caller.__class__.name,
-                    str(caller.compPos),
-                    name,
-                    'an' if any([
-                        sys.exc_info()[0].__name__.startswith(vowel)  # type: ignore
-                        for vowel in ('A', 'I', 'U', 'O', 'E')
-                    ]) else 'a',
-                    sys.exc_info()[0].__name__,  # type: ignore
-                    str(sys.exc_info()[1])  # type: ignore
-                )
-            )
-            detail = formatTraceback(sys.exc_info()[2])  # type: ignore
-        else:
-            string = name
-            detail = "Attributes:\n%s" % (
-                "\n".join(
-                    [m for m in dir(caller) if not m.startswith('_')]
-                )
-            )
+        string = _reportComponentError(caller, name, msg)
+        if string is not None:
+            super().__init__(string)
 
-        super().__init__(string)
-        caller.lockError(string)
-        caller._error.emit(string, detail)
+
+_IMMUTABLE_TYPES = (int, float, str, bool, tuple, type(None))
+
+
+def _snapshot(val: Any) -> Any:
+    '''copy() a value for the undo stack; immutable scalars pass through'''
+    return val if type(val) in _IMMUTABLE_TYPES else copy(val)
 
 
 class ComponentUpdate(QtWidgets.QUndoCommand):
@@ -858,32 +969,36 @@ class ComponentUpdate(QtWidgets.QUndoCommand):
         self.undone: bool = False
         self.res: Tuple[int, int] = (int(parent.width), int(parent.height))
         self.parent: Component = parent
-        self.oldWidgetVals: Dict[str, Any] = {
-            attr: copy(val)
-            if attr not in self.parent._relativeWidgets
-            else self.parent.floatValForAttr(attr, val, axis=self.res)
-            for attr, val in oldWidgetVals.items()
-            if attr in modifiedVals
-        }
-        self.modifiedVals: Dict[str, Any] = {
-            attr: val
-            if attr not in self.parent._relativeWidgets
-            else self.parent.floatValForAttr(attr, val, axis=self.res)
-            for attr, val in modifiedVals.items()
-        }
+        # One pass over the (usually single-entry) modifiedVals builds
+        # both dicts, testing relative-widget membership once per attr
+        relativeWidgets = parent._relativeWidgets
+        floatValForAttr = parent.floatValForAttr
+        res = self.res
+        self.oldWidgetVals: Dict[str, Any] = {}
+        self.modifiedVals: Dict[str, Any] = {}
+        for attr, val in modifiedVals.items():
+            if attr in relativeWidgets:
+                self.modifiedVals[attr] = floatValForAttr(attr, val, axis=res)
+                if attr in oldWidgetVals:
+                    self.oldWidgetVals[attr] = floatValForAttr(
+                        attr, oldWidgetVals[attr], axis=res)
+            else:
+                self.modifiedVals[attr] = val
+                if attr in oldWidgetVals:
+                    self.oldWidgetVals[attr] = copy(oldWidgetVals[attr])
 
         # Because relative widgets change themselves every update based on
         # their previous value, we must store ALL their values in case of undo
         self.relativeWidgetValsAfterUndo: Dict[str, Any] = {
-            attr: copy(getattr(self.parent, attr))
-            for attr in self.parent._relativeWidgets
+            attr: _snapshot(getattr(parent, attr))
+            for attr in parent._relativeWidgets
         }
 
         # Determine if this update is mergeable
         self.id_: int = -1
         if len(self.modifiedVals) == 1 and self.parent.mergeUndo:
             attr, val = self.modifiedVals.popitem()
-            self.id_ = sum([ord(letter) for letter in attr[-14:]])
+            self.id_ = sum(map(ord, attr[-14:]))
             self.modifiedVals[attr] = val
         else:
             log.warning(
@@ -919,11 +1034,12 @@ class ComponentUpdate(QtWidgets.QUndoCommand):
         self.parent.update(auto=True)
         self.parent.oldAttrs = None
         if not self.undone:
+            parent = self.parent
             self.relativeWidgetValsAfterRedo = {
-                attr: copy(getattr(self.parent, attr))
-                for attr in self.parent._relativeWidgets
+                attr: _snapshot(getattr(parent, attr))
+                for attr in parent._relativeWidgets
             }
-            self.parent._sendUpdateSignal()
+            parent._sendUpdateSignal()
 
     def undo(self) -> None:
         log.info('Undoing component update')
@@ -1,5 +1,6 @@
 from PIL import Image, ImageDraw, ImageEnhance
 from PyQt5 import QtGui, QtCore, QtWidgets
+import numpy as np
 import os
 from typing import List, Dict, Any, Tuple, Optional
 
@@ -13,6 +14,21 @@ class Component(Component):
     def widget(self, *args: Any) -> None:
         super().widget(*args)
         self.page.pushButton_image.clicked.connect(self.pickImage)
+        # Decoded source image, valid while (path, mtime) is unchanged
+        self._imgCache: Optional[Tuple[str, int, Image.Image]] = None
+        # Processed (color/mirror/stretch/scale/rotate) variant with its
+        # paste offset, keyed by params
+        self._procCache: Optional[
+            Tuple[tuple, Image.Image, Tuple[int, int]]] = None
+        # Reusable RGBA composition buffer for the opaque fast path
+        self._frameBuf: Optional[np.ndarray] = None
+        # Last stat of imagePath: avoids a syscall per rendered frame
+        self._statPath: Optional[str] = None
+        self._pathMtime: Optional[int] = None
+        # Finished frame: a static component renders identically for
+        # every frameNo, so repeat calls return the same image
+        self._lastKey: Optional[tuple] = None
+        self._lastFrame: Optional[Image.Image] = None
         self.trackWidgets({
             'imagePath': self.page.lineEdit_image,
             'scale': self.page.spinBox_scale,
@@ -32,51 +48,152 @@ class Component(Component):
         ])
 
     def previewRender(self) -> QtGui.QImage:
-        return self.drawFrame(self.width, self.height)
+        # Previews favour responsiveness over resampling quality
+        return self.drawFrame(self.width, self.height, Image.BILINEAR)
 
     def properties(self) -> List[str]:
+        self._updatePathStatus()
         props = ['static']
-        if not os.path.exists(self.imagePath): # type: ignore
+        if self._pathMtime is None:
             props.append('error')
         return props
 
     def error(self) -> Optional[str]:
         if not self.imagePath: # type: ignore
             return "There is no image selected."
-        if not os.path.exists(self.imagePath): # type: ignore
+        if self._pathMtime is None:
             return "The image selected does not exist!"
         return None
 
+    def _updatePathStatus(self) -> None:
+        '''Stat imagePath once per change instead of once per frame'''
+        path = self.imagePath # type: ignore
+        try:
+            self._pathMtime = os.stat(path).st_mtime_ns if path else None
+        except OSError:
+            self._pathMtime = None
+        self._statPath = path
+
     def frameRender(self, frameNo: int) -> QtGui.QImage:
         return self.drawFrame(self.width, self.height)
 
-    def drawFrame(self, width: int, height: int) -> QtGui.QImage:
-        frame = BlankFrame(width, height)
-        if self.imagePath and os.path.exists(self.imagePath): # type: ignore
-            scale = self.scale if not self.stretched else self.stretchScale # type: ignore
-            image = Image.open(self.imagePath) # type: ignore
+    def drawFrame(
+            self, width: int, height: int,
+            resample: int = Image.ANTIALIAS) -> QtGui.QImage:
+        if self._statPath != self.imagePath: # type: ignore
+            self._updatePathStatus()
+        mtime = self._pathMtime
+        if not self.imagePath or mtime is None: # type: ignore
+            return BlankFrame(width, height)
+
+        scale = self.scale if not self.stretched else self.stretchScale # type: ignore
+        frameKey = (
+            self.imagePath, mtime, self.color, self.mirror, # type: ignore
+            self.stretched, width, height, scale, resample, # type: ignore
+            self.rotate, self.xPosition, self.yPosition, # type: ignore
+        )
+        if frameKey == self._lastKey:
+            # Static component: every frameNo yields the same image
+            return self._lastFrame
+        procKey = frameKey[:10]  # position doesn't affect processing
+        if self._procCache is not None \
+                and self._procCache[0] == procKey:
+            _, image, (offsetX, offsetY) = self._procCache
+        else:
+            image = self._openImage(self.imagePath, mtime) # type: ignore
 
             # Modify image's appearance
-            if self.color != 100: # type: ignore
+            if self.color == 0: # type: ignore
+                # Full desaturation: a plain grayscale conversion beats
+                # ImageEnhance's blend against an L copy
+                image = image.convert('L').convert(image.mode)
+            elif self.color != 100: # type: ignore
                 image = ImageEnhance.Color(image).enhance(
-                    float(self.color / 100) # type: ignore
+                    self.color / 100.0 # type: ignore
                 )
             if self.mirror: # type: ignore
                 image = image.transpose(Image.FLIP_LEFT_RIGHT)
-            if self.stretched and image.size != (width, height): # type: ignore
-                image = image.resize((width, height), Image.ANTIALIAS)
-            if scale != 100:
-                newHeight = int((image.height / 100) * scale)
-                newWidth = int((image.width / 100) * scale)
-                image = image.resize((newWidth, newHeight), Image.ANTIALIAS)
 
-            # Paste image at correct position
-            frame.paste(image, box=(self.xPosition, self.yPosition)) # type: ignore
+            # Compose stretch and scale into one resample pass
+            if self.stretched: # type: ignore
+                baseWidth, baseHeight = width, height
+            else:
+                baseWidth, baseHeight = image.width, image.height
+            if scale != 100:
+                finalSize = (
+                    int((baseWidth / 100) * scale),
+                    int((baseHeight / 100) * scale),
+                )
+            else:
+                finalSize = (baseWidth, baseHeight)
+            if image.size != finalSize:
+                image = image.resize(finalSize, resample)
+
+            # Rotate the (smaller) source once instead of spinning the
+            # whole composited frame every call; keep its centre fixed
+            offsetX = offsetY = 0
             if self.rotate != 0: # type: ignore
-                frame = frame.rotate(self.rotate) # type: ignore
+                if image.mode != 'RGBA':
+                    # Expanded corners must stay transparent
+                    image = image.convert('RGBA')
+                preWidth, preHeight = image.size
+                image = image.rotate(
+                    self.rotate, resample=Image.BILINEAR, # type: ignore
+                    expand=True
+                )
+                offsetX = (image.width - preWidth) // 2
+                offsetY = (image.height - preHeight) // 2
+            self._procCache = (procKey, image, (offsetX, offsetY))
+
+        # Paste image at correct position
+        frame = self._composite(
+            BlankFrame(width, height), image,
+            self.xPosition - offsetX, self.yPosition - offsetY) # type: ignore
+        self._lastKey = frameKey
+        self._lastFrame = frame
+        return frame
 
+    def _composite(
+            self, frame: Image.Image, image: Image.Image,
+            x: int, y: int) -> Image.Image:
+        '''
+            Place the image on the frame with a numpy slice assignment
+            instead of PIL's generic per-pixel paste. The frame starts
+            out fully transparent, so compositing "over" it reduces to a
+            straight copy even for images with an alpha channel.
+        '''
+        if image.mode in ('RGB', 'L', 'RGBA', 'LA'):
+            width, height = frame.size
+            buf = self._frameBuf
+            if buf is None or buf.shape[0] != height \
+                    or buf.shape[1] != width:
+                buf = np.zeros((height, width, 4), dtype=np.uint8)
+                self._frameBuf = buf
+            else:
+                buf.fill(0)
+            if image.mode != 'RGBA':
+                image = image.convert('RGBA')
+            arr = np.asarray(image)
+            imgHeight, imgWidth = arr.shape[:2]
+            x0, y0 = max(x, 0), max(y, 0)
+            x1 = min(x + imgWidth, width)
+            y1 = min(y + imgHeight, height)
+            if x1 > x0 and y1 > y0:
+                buf[y0:y1, x0:x1] = arr[y0 - y:y1 - y, x0 - x:x1 - x]
+            return Image.fromarray(buf, 'RGBA')
+        frame.paste(image, box=(x, y))
         return frame
 
+    def _openImage(self, path: str, mtime: int) -> Image.Image:
+        '''Decode the source image once per (path, mtime)'''
+        cache = self._imgCache
+        if cache is not None and cache[0] == path and cache[1] == mtime:
+            return cache[2]
+        image = Image.open(path)
+        image.load()
+        self._imgCache = (path, mtime, image)
+        return image
+
     def pickImage(self) -> None:
         imgDir = self.settings.value("componentDir", os.path.expanduser("~"))
         filename, _ = QtWidgets.QFileDialog.getOpenFileName(
@@ -1,10 +1,10 @@
 import numpy as np
-from PIL import Image, ImageDraw
+from PIL import Image
 from PyQt5 import QtGui, QtCore, QtWidgets
 from PyQt5.QtGui import QColor
 import os
 import time
-from copy import copy
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Tuple, Optional
 
 from ..component import Component
@@ -24,6 +24,8 @@ class Component(Component):
     def widget(self, *args: Any) -> None:
         self.scale: int = 20
         self.y: int = 0
+        # Reusable RGBA buffer the bars are rasterized into
+        self._barBuf: Optional[np.ndarray] = None
         super().widget(*args)
 
         self.page.comboBox_visLayout.addItem("Classic")
@@ -57,93 +59,132 @@ class Component(Component):
         super().preFrameRender(**kwargs)
         self.smoothConstantDown: float = 0.08 + 0 if not self.smooth else self.smooth / 15 # type: ignore
         self.smoothConstantUp: float = 0.8 - 0 if not self.smooth else self.smooth / 15 # type: ignore
-        self.lastSpectrum: Optional[np.ndarray] = None
-        self.spectrumArray: Dict[int, np.ndarray] = {}
-
-        for i in range(0, len(self.completeAudioArray), self.sampleSize): # type: ignore
+        spectra = self._batchSpectra(
+            self.completeAudioArray, self.sampleSize) # type: ignore
+
+        # The smoothing recurrence is sequential across frames, but each
+        # row is smoothed in place against the previous one, so the
+        # batched 2-D array doubles as the per-frame spectrum store —
+        # no per-frame copies and no dict keyed by byte offset
+        down = self.smoothConstantDown
+        up = self.smoothConstantUp
+        rowCount = len(spectra)
+        lastProgress = -1
+        for row in range(1, rowCount):
             if self.canceled:
                 break
-            self.lastSpectrum = self.transformData(
-                i, self.completeAudioArray, self.sampleSize, # type: ignore
-                self.smoothConstantDown, self.smoothConstantUp,
-                self.lastSpectrum)
-            self.spectrumArray[i] = copy(self.lastSpectrum)
-
-            progress = int(100*(i/len(self.completeAudioArray))) # type: ignore
+            y = spectra[row]
+            prev = spectra[row - 1]
+            falling = y < prev
+            y[falling] = y[falling] * down + prev[falling] * (1 - down)
+            np.logical_not(falling, out=falling)
+            y[falling] = y[falling] * up + prev[falling] * (1 - up)
+
+            # Only cross into Qt when the visible percentage changes
+            progress = int(100*(row/rowCount))
             if progress >= 100:
                 progress = 100
-            pStr = "Analyzing audio: "+str(progress)+'%'
-            self.progressBarSetText.emit(pStr) # type: ignore
-            self.progressBarUpdate.emit(int(progress)) # type: ignore
+            if progress != lastProgress:
+                lastProgress = progress
+                pStr = "Analyzing audio: "+str(progress)+'%'
+                self.progressBarSetText.emit(pStr) # type: ignore
+                self.progressBarUpdate.emit(progress) # type: ignore
+
+        self.spectrumArray: np.ndarray = spectra
+        self.lastSpectrum: Optional[np.ndarray] = \
+            spectra[-1] if rowCount else None
 
     def frameRender(self, frameNo: int) -> Image.Image:
-        arrayNo = frameNo * self.sampleSize
         return self.drawBars(
             self.width, self.height,
-            self.spectrumArray[arrayNo],
+            self.spectrumArray[frameNo],
             self.visColor, self.layout) # type: ignore
 
-    def transformData(
-      self, i: int, completeAudioArray: np.ndarray, sampleSize: int,
-      smoothConstantDown: float, smoothConstantUp: float, lastSpectrum: Optional[np.ndarray]
-      ) -> np.ndarray:
-        if len(completeAudioArray) < (i + sampleSize):
-            sampleSize = len(completeAudioArray) - i
-
-        window = np.hanning(sampleSize)
-        data = completeAudioArray[i:i+sampleSize][::1] * window
+    def _batchSpectra(self, audio: np.ndarray, sampleSize: int) -> np.ndarray:
+        '''
+            One windowed rFFT over all frames at once instead of one FFT
+            call (plus a fresh hanning window) per frame. Returns the
+            scaled log-magnitude rows, unsmoothed.
+        '''
         paddedSampleSize = 2048
-        paddedData = np.pad(
-            data, (0, paddedSampleSize - sampleSize), 'constant')
-        spectrum = np.fft.fft(paddedData)
-        sample_rate = 44100
-        frequencies = np.fft.fftfreq(len(spectrum), 1./sample_rate)
-
-        y = abs(spectrum[0:int(paddedSampleSize/2) - 1])
-
-        # filter the noise away
-        # y[y<80] = 0
+        bins = int(paddedSampleSize / 2) - 1
 
-        y = self.scale * np.log10(y) # type: ignore
-        y[np.isinf(y)] = 0
-
-        if lastSpectrum is not None:
-            lastSpectrum[y < lastSpectrum] = \
-                y[y < lastSpectrum] * smoothConstantDown + \
-                lastSpectrum[y < lastSpectrum] * (1 - smoothConstantDown)
-
-            lastSpectrum[y >= lastSpectrum] = \
-                y[y >= lastSpectrum] * smoothConstantUp + \
-                lastSpectrum[y >= lastSpectrum] * (1 - smoothConstantUp)
+        fullCount = len(audio) // sampleSize
+        window = np.hanning(sampleSize)
+        frames = audio[:fullCount * sampleSize].reshape(-1, sampleSize) \
+            * window
+        frames = np.pad(
+            frames, ((0, 0), (0, paddedSampleSize - sampleSize)),
+            'constant')
+
+        # numpy's FFT releases the GIL, so row blocks transform in
+        # parallel across a thread pool on longer songs
+        workers = os.cpu_count() or 1
+        if workers > 1 and len(frames) >= workers * 4:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                spectra = np.vstack(list(pool.map(
+                    lambda block: np.abs(
+                        np.fft.rfft(block, axis=1)[:, :bins]),
+                    np.array_split(frames, workers))))
         else:
-            lastSpectrum = y
+            spectra = np.abs(np.fft.rfft(frames, axis=1)[:, :bins])
 
-        x = frequencies[0:int(paddedSampleSize/2) - 1]
+        # A final partial chunk gets its own, shorter window
+        remainder = len(audio) - fullCount * sampleSize
+        if remainder:
+            tail = audio[fullCount * sampleSize:] * np.hanning(remainder)
+            tail = np.pad(tail, (0, paddedSampleSize - remainder), 'constant')
+            tailSpectrum = np.abs(np.fft.rfft(tail)[:bins])
+            spectra = np.vstack((spectra, tailSpectrum[np.newaxis]))
 
-        return lastSpectrum # type: ignore
+        spectra = self.scale * np.log10(spectra) # type: ignore
+        spectra[np.isinf(spectra)] = 0
+        return spectra
 
     def drawBars(self, width: int, height: int, spectrum: np.ndarray, color: Tuple[int, int, int], layout: int) -> Image.Image:
         vH = height-height/8
         bF = width / 64
         bH = bF / 2
         bQ = bF / 4
-        imTop = BlankFrame(width, height)
-        draw = ImageDraw.Draw(imTop)
         r, g, b = color
         color2 = (r, g, b, 125)
 
         bP = height / 1200
 
-        for j in range(0, 63):
-            draw.rectangle((
-                bH + j * bF, vH+bQ, bH + j * bF + bF, vH + bQ -
-                spectrum[j * 4] * bP - bH), fill=color2)
-
-            draw.rectangle((
-                bH + bQ + j * bF, vH, bH + bQ + j * bF + bH, vH -
-                spectrum[j * 4] * bP), fill=color)
+        # Rasterize the bars with two numpy region writes each instead
+        # of 126 ImageDraw.rectangle calls crossing into C per frame
+        arr = self._barBuf
+        if arr is None or arr.shape[0] != height or arr.shape[1] != width:
+            arr = np.zeros((height, width, 4), dtype=np.uint8)
+            self._barBuf = arr
+        else:
+            arr.fill(0)
+
+        def fillRect(x0: float, y0: float, x1: float, y1: float,
+                     rgba: Tuple[int, int, int, int]) -> None:
+            if x1 < x0:
+                x0, x1 = x1, x0
+            if y1 < y0:
+                y0, y1 = y1, y0
+            left, top = max(int(x0), 0), max(int(y0), 0)
+            right, bottom = min(int(x1), width - 1), min(int(y1), height - 1)
+            if right >= left and bottom >= top:
+                arr[top:bottom + 1, left:right + 1] = rgba
 
-        imBottom = imTop.transpose(Image.FLIP_TOP_BOTTOM)
+        for j in range(0, 63):
+            barHeight = spectrum[j * 4] * bP
+            barX = bH + j * bF
+            fillRect(
+                barX, vH + bQ, barX + bF, vH + bQ - barHeight - bH, color2)
+            fillRect(
+                barX + bQ, vH, barX + bQ + bH, vH - barHeight,
+                (r, g, b, 255))
+
+        imTop = Image.fromarray(arr, 'RGBA')
+
+        # Bottom layout never shows the flipped copy; skip the transpose
+        imBottom = imTop.transpose(Image.FLIP_TOP_BOTTOM) \
+            if layout != 2 else None
 
         im = BlankFrame(width, height)
 
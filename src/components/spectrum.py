@@ -1,11 +1,12 @@
 from PIL import Image
 from PyQt5 import QtGui, QtCore, QtWidgets
+import numpy as np
 import os
 import math
 import subprocess
 import time
 import logging
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Union
 
 from ..component import Component
 from ..toolkit.frame import BlankFrame, scale
@@ -17,11 +18,32 @@ from ..toolkit.ffmpeg import (
 
 log = logging.getLogger('AVP.Components.Spectrum')
 
+# FFmpeg scale names indexed straight by the amplitude/display combo
+# boxes, replacing if/elif ladders in the filter builder
+_AMP_SPECTRUM = ('sqrt', 'cbrt', '4thrt', '5thrt', 'lin', 'log')
+_AMP_HISTOGRAM = ('log', 'lin')
+_DISPLAY_HISTOGRAM = ('log', 'sqrt', 'cbrt', 'lin', 'rlog')
+_AMP_VECTORSCOPE = ('log', 'sqrt', 'cbrt', 'lin')
+
+
+def _alignedBuffer(size: int) -> memoryview:
+    '''
+        A writable 32-byte-aligned buffer; PIL's vectorized raw decoder
+        gets whole aligned loads when the pipe read lands here
+    '''
+    raw = np.empty(size + 32, dtype=np.uint8)
+    offset = (-raw.ctypes.data) % 32
+    return memoryview(raw)[offset:offset + size]
+
 
 class Component(Component):
     name = 'Spectrum'
     version = '1.0.1'
 
+    # Tracked options that only affect how the finished analyzer image
+    # is composited onto the frame, never the FFmpeg graph drawing it
+    _compositeOptions = frozenset(('x', 'y'))
+
     def widget(self, *args: Any) -> None:
         self.previewFrame: Optional[QtGui.QImage] = None
         super().widget(*args)
@@ -30,6 +52,22 @@ class Component(Component):
         self.changedOptions: bool = True
         self.previewSize: Tuple[int, int] = (214, 120)
         self.previewPipe: Optional[subprocess.Popen] = None
+        # Assembled filter-complex strings keyed by the options that
+        # shape them; cleared whenever a tracked widget changes
+        self._filterCache: Dict[tuple, str] = {}
+        # Raw chunk backing the zero-copy frombuffer image, plus the
+        # reusable destination frame it gets pasted onto
+        self._imageData: Union[bytes, memoryview] = b''
+        self._blank: Optional[Image.Image] = None
+        # Rectangle pasted on the previous frame; a change means the
+        # old pixels must not ghost into the next composite
+        self._lastBox: Optional[tuple] = None
+        # Aligned, reusable target for preview pipe reads
+        self._readBuf: Optional[memoryview] = None
+        # Raw analyzer output from the last preview, with the graph key
+        # that produced it; position-only edits re-composite this
+        # instead of spawning another FFmpeg process
+        self._previewCache: Optional[Tuple[tuple, memoryview]] = None
 
         if hasattr(self.parent, 'lineEdit_audioFile'):
             # update preview when audio file changes (if genericPreview is off)
@@ -64,6 +102,7 @@ class Component(Component):
 
     def changed(self) -> None:
         self.changedOptions = True
+        self._filterCache.clear()
 
     def update(self) -> None:
         filterType = self.page.comboBox_filterType.currentIndex()
@@ -133,8 +172,21 @@ class Component(Component):
                 return None
             startPt = duration / 3
 
+        # Spawning FFmpeg and seeding the analyzer dominate preview
+        # latency; if nothing that shapes the graph changed (e.g. only
+        # x/y moved), re-composite the raw bytes from last time
+        graphKey = self._graphKey(True, startPt) + (self.chunkSize,)
+        cached = self._previewCache
+        if cached is not None and cached[0] == graphKey:
+            return self.finalizeFrame(cached[1])
+
+        filterThreads = str(os.cpu_count() or 4)
         command = [
             self.core.FFMPEG_BIN,
+            '-threads', '0',
+            # the show* analyzers run single-threaded unless told not to
+            '-filter_threads', filterThreads,
+            '-filter_complex_threads', filterThreads,
             '-thread_queue_size', '512',
             '-r', str(self.settings.value("outputFrameRate")),
             '-ss', "{0:.3f}".format(startPt),
@@ -161,23 +213,63 @@ class Component(Component):
             with open(logFilename, 'a') as logf:
                 self.previewPipe = openPipe(
                     command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
-                    stderr=logf, bufsize=10**8
+                    stderr=logf, bufsize=1 << 20
                 )
         else:
             self.previewPipe = openPipe(
                 command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL, bufsize=10**8
+                stderr=subprocess.DEVNULL, bufsize=1 << 20
             )
         if not self.previewPipe:
             return None
-        byteFrame = self.previewPipe.stdout.read(self.chunkSize) # type: ignore
+        buf = self._readBuf
+        if buf is None or len(buf) != self.chunkSize:
+            buf = _alignedBuffer(self.chunkSize)
+            self._readBuf = buf
+        # A pipe read may return short of a full frame; keep filling the
+        # buffer so a slow FFmpeg start doesn't silently drop the
+        # preview back to the previous image
+        bytesRead = 0
+        while bytesRead < self.chunkSize:
+            n = self.previewPipe.stdout.readinto( # type: ignore
+                buf[bytesRead:])
+            if not n:
+                break
+            bytesRead += n
         closePipe(self.previewPipe)
 
-        frame = self.finalizeFrame(byteFrame)
+        if bytesRead == self.chunkSize:
+            # The cache takes over this buffer; the next actual pipe
+            # read gets a fresh one
+            self._previewCache = (graphKey, buf[:bytesRead])
+            self._readBuf = None
+
+        frame = self.finalizeFrame(buf[:bytesRead])
         return frame
 
+    def _graphKey(self, preview: bool = False, startPt: float = 0.0) -> tuple:
+        '''The values that shape the FFmpeg filter graph. Composite-only
+        options are left out, so edits to them keep the key stable and
+        reuse any cached graph output.'''
+        # width/height/frame rate are baked into the filter string but
+        # change through invalidateSize() without firing changed(), so
+        # they must be part of the key rather than rely on invalidation
+        return tuple(
+            getattr(self, attr) for attr in self._trackedWidgets
+            if attr not in self._compositeOptions
+        ) + (
+            self.width, self.height,
+            str(self.settings.value("outputFrameRate")),
+            bool(self.settings.value("pref_genericPreview")),
+            preview, round(startPt, 3),
+        )
+
     def makeFfmpegFilter(self, preview: bool = False, startPt: float = 0.0) -> List[str]:
         '''Makes final FFmpeg filter command'''
+        cacheKey = self._graphKey(preview, startPt)
+        cached = self._filterCache.get(cacheKey)
+        if cached is not None:
+            return ['-filter_complex', cached, '-map', '[v]']
 
         def getFilterComplexCommand() -> str:
             '''Inner function that creates the final, complex part of the filter command'''
@@ -187,6 +279,8 @@ class Component(Component):
             def getFilterComplexCommandForType() -> str:
                 '''Determine portion of filter command that changes depending on selected type'''
                 nonlocal self
+                # one QSettings hit instead of one per filter branch
+                fr = str(self.settings.value("outputFrameRate"))
                 if preview:
                     w, h = self.previewSize
                 else:
@@ -194,18 +288,7 @@ class Component(Component):
                 color = self.page.comboBox_color.currentText().lower()
 
                 if self.filterType == 0:  # Spectrum
-                    if self.amplitude == 0: # type: ignore
-                        amplitude = 'sqrt'
-                    elif self.amplitude == 1: # type: ignore
-                        amplitude = 'cbrt'
-                    elif self.amplitude == 2: # type: ignore
-                        amplitude = '4thrt'
-                    elif self.amplitude == 3: # type: ignore
-                        amplitude = '5thrt'
-                    elif self.amplitude == 4: # type: ignore
-                        amplitude = 'lin'
-                    elif self.amplitude == 5: # type: ignore
-                        amplitude = 'log'
+                    amplitude = _AMP_SPECTRUM[self.amplitude] # type: ignore
                     filter_ = (
                         f'showspectrum=s={w}x{h}:'
                         'slide=scroll:'
@@ -216,36 +299,17 @@ class Component(Component):
                         'similarity=0.1:blend=0.5'
                     )
                 elif self.filterType == 1:  # Histogram
-                    if self.amplitude1 == 0: # type: ignore
-                        amplitude = 'log'
-                    elif self.amplitude1 == 1: # type: ignore
-                        amplitude = 'lin'
-                    if self.display == 0: # type: ignore
-                        display = 'log'
-                    elif self.display == 1: # type: ignore
-                        display = 'sqrt'
-                    elif self.display == 2: # type: ignore
-                        display = 'cbrt'
-                    elif self.display == 3: # type: ignore
-                        display = 'lin'
-                    elif self.display == 4: # type: ignore
-                        display = 'rlog'
+                    amplitude = _AMP_HISTOGRAM[self.amplitude1] # type: ignore
+                    display = _DISPLAY_HISTOGRAM[self.display] # type: ignore
                     filter_ = (
-                        f'ahistogram=r={str(self.settings.value("outputFrameRate"))}:'
+                        f'ahistogram=r={fr}:'
                         f's={w}x{h}:'
                         'dmode=separate:'
                         f'ascale={amplitude}:'
                         f'scale={display}'
                     )
                 elif self.filterType == 2:  # Vector Scope
-                    if self.amplitude2 == 0: # type: ignore
-                        amplitude = 'log'
-                    elif self.amplitude2 == 1: # type: ignore
-                        amplitude = 'sqrt'
-                    elif self.amplitude2 == 2: # type: ignore
-                        amplitude = 'cbrt'
-                    elif self.amplitude2 == 3: # type: ignore
-                        amplitude = 'lin'
+                    amplitude = _AMP_VECTORSCOPE[self.amplitude2] # type: ignore
                     m = self.page.comboBox_mode.currentText()
                     filter_ = (
                         f'avectorscope=s={w}x{h}:'
@@ -256,7 +320,7 @@ class Component(Component):
                     )
                 elif self.filterType == 3:  # Musical Scale
                     filter_ = (
-                        f'showcqt=r={str(self.settings.value("outputFrameRate"))}:'
+                        f'showcqt=r={fr}:'
                         f's={w}x{h}:'
                         'count=30:'
                         'text=0:'
@@ -266,7 +330,7 @@ class Component(Component):
                     )
                 elif self.filterType == 4:  # Phase
                     filter_ = (
-                        f'aphasemeter=r={str(self.settings.value("outputFrameRate"))}:'
+                        f'aphasemeter=r={fr}:'
                         f's={w}x{h}:'
                         'video=1 [atrash][vtmp1]; '
                         '[atrash] anullsink; '
@@ -299,9 +363,11 @@ class Component(Component):
             )
 
 
+        filterCommand = getFilterComplexCommand()
+        self._filterCache[cacheKey] = filterCommand
         return [
             '-filter_complex',
-            getFilterComplexCommand(),
+            filterCommand,
             '-map', '[v]',
         ]
 
@@ -312,17 +378,37 @@ class Component(Component):
         changed = self.chunkSize != oldChunkSize
         return changed
 
-    def finalizeFrame(self, imageData: bytes) -> QtGui.QImage:
+    def finalizeFrame(
+            self, imageData: Union[bytes, memoryview]) -> QtGui.QImage:
         try:
-            image = Image.frombytes(
+            # frombuffer maps the raw FFmpeg chunk instead of copying it
+            # like frombytes; the data must be kept alive alongside
+            image = Image.frombuffer(
                 'RGBA',
                 scale(self.scale, self.width, self.height, int), # type: ignore
-                imageData
+                imageData, 'raw', 'RGBA', 0, 1
             )
+            self._imageData = imageData
             self._image = image
         except ValueError:
             image = self._image
 
-        frame = BlankFrame(self.width, self.height)
+        if image.size == (self.width, self.height) \
+                and self.x == 0 and self.y == 0: # type: ignore
+            return image
+
+        # One persistent destination frame; the paste box is constant
+        # within a render, so each frame fully overwrites the last.
+        # When the box does move (position edits between previews, or
+        # the first export frame after a preview elsewhere), start from
+        # a fresh blank so the old rectangle can't ghost through
+        box = (self.x, self.y) + image.size # type: ignore
+        blank = self._blank
+        if blank is None or blank.size != (self.width, self.height) \
+                or box != self._lastBox:
+            blank = BlankFrame(self.width, self.height)
+            self._blank = blank
+            self._lastBox = box
+        frame = blank
         frame.paste(image, box=(self.x, self.y)) # type: ignore
         return frame
\ No newline at end of file
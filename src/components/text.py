@@ -1,4 +1,4 @@
-from PIL import ImageEnhance, ImageFilter, ImageChops
+from PIL import Image, ImageFilter
 from PyQt5.QtGui import QColor, QFont
 from PyQt5 import QtGui, QtCore, QtWidgets
 import os
@@ -6,7 +6,7 @@ import logging
 from typing import List, Dict, Any, Tuple, Optional, Union
 
 from ..component import Component
-from ..toolkit.frame import FramePainter, PaintColor
+from ..toolkit.frame import BlankFrame, FramePainter, PaintColor
 
 log = logging.getLogger('AVP.Components.Text')
 
@@ -21,6 +21,19 @@ class Component(Component):
         self.alignment: int = 1
         self.titleFont: QtGui.QFont = QFont()
         self.fontSize: float = self.height / 13.5
+        # Font metrics and measured advances, keyed by font and text;
+        # static text makes these hits on every frame of an export
+        self._fmCache: Dict[tuple, Tuple[QtGui.QFontMetrics, int]] = {}
+        # Finished text frame: the component is static, so every
+        # frameNo repaints the same image
+        self._renderCache: Optional[Tuple[tuple, Any]] = None
+        # Blurred shadow silhouette; moving the offset spinboxes only
+        # re-pastes it rather than re-running the blur
+        self._shadowCache: Optional[Tuple[tuple, Any]] = None
+        # Stroked outline path; walking every glyph outline again is
+        # wasted work when only colours changed
+        self._strokedPath: Optional[QtGui.QPainterPath] = None
+        self._strokedPathKey: Optional[tuple] = None
 
         self.page.comboBox_textAlign.addItem("Left")
         self.page.comboBox_textAlign.addItem("Middle")
@@ -30,7 +43,7 @@ class Component(Component):
         self.page.lineEdit_title.setText(self.title)
         self.page.pushButton_center.clicked.connect(self.centerXY)
 
-        self.page.fontComboBox_titleFont.currentFontChanged.connect(self._sendUpdateSignal)
+        self.page.fontComboBox_titleFont.currentFontChanged.connect(self._forceUpdateSignal)
         # The QFontComboBox must be connected directly to the Qt Signal
         # which triggers the preview to update.
         # This unfortunately makes changing the font into a non-undoable action.
@@ -61,6 +74,11 @@ class Component(Component):
 
     def update(self) -> None:
         self.titleFont = self.page.fontComboBox_titleFont.currentFont()
+        self._fmCache.clear()
+        self._renderCache = None
+        self._shadowCache = None
+        self._strokedPath = None
+        self._strokedPathKey = None
         if self.page.checkBox_shadow.isChecked():
             self.page.label_shadX.setHidden(False)
             self.page.spinBox_shadX.setHidden(False)
@@ -80,18 +98,28 @@ class Component(Component):
 
     def getXY(self) -> Tuple[int, int]:
         '''Returns true x, y after considering alignment settings'''
-        fm = QtGui.QFontMetrics(self.titleFont)
+        _, titleWidth = self._fontMetrics(self.titleFont, self.title) # type: ignore
         x = self.pixelValForAttr('xPosition')
 
         if self.alignment == 1:             # Middle
-            offset = int(fm.width(self.title)/2)
-            x -= offset
+            x -= int(titleWidth / 2)
         if self.alignment == 2:             # Right
-            offset = fm.width(self.title) # type: ignore
-            x -= offset
+            x -= titleWidth
 
         return x, self.yPosition # type: ignore
 
+    def _fontMetrics(
+            self, font: QtGui.QFont, text: str
+            ) -> Tuple[QtGui.QFontMetrics, int]:
+        '''Metrics & advance for this font/text, shaped only once'''
+        key = (font.key(), int(self.fontSize), self.fontStyle, text) # type: ignore
+        hit = self._fmCache.get(key)
+        if hit is None:
+            fm = QtGui.QFontMetrics(font)
+            hit = (fm, fm.horizontalAdvance(text))
+            self._fmCache[key] = hit
+        return hit
+
     def loadPreset(self, pr: Dict[str, Any], *args: Any) -> None:
         super().loadPreset(pr, *args)
 
@@ -120,64 +148,112 @@ class Component(Component):
         return self.addText(self.width, self.height)
 
     def addText(self, width: int, height: int) -> QtGui.QImage:
+        # tracked values are plain attributes, but the hot path below
+        # reads several of them repeatedly; read each once
+        title = self.title # type: ignore
+        fontSize = int(self.fontSize) # type: ignore
+        fontStyle = self.fontStyle # type: ignore
+        strokeWidth = self.stroke # type: ignore
+        renderKey = (
+            width, height, title, fontSize, fontStyle,
+            self.alignment, # type: ignore
+            tuple(self.textColor), tuple(self.strokeColor), # type: ignore
+            strokeWidth, self.shadow, self.shadX, self.shadY, # type: ignore
+            self.shadBlur, self.titleFont.toString(), # type: ignore
+            self.xPosition, self.yPosition, # type: ignore
+        )
+        if self._renderCache is not None \
+                and self._renderCache[0] == renderKey:
+            return self._renderCache[1]
+
         font = self.titleFont
-        font.setPixelSize(int(self.fontSize)) #Ensures that the value is an integer
+        font.setPixelSize(fontSize) #Ensures that the value is an integer
         font.setStyle(QFont.StyleNormal)
         font.setWeight(QFont.Normal)
         font.setCapitalization(QFont.MixedCase)
-        if self.fontStyle == 1: # type: ignore
+        if fontStyle == 1:
             font.setWeight(QFont.DemiBold)
-        if self.fontStyle == 2: # type: ignore
+        if fontStyle == 2:
             font.setWeight(QFont.Bold)
-        elif self.fontStyle == 3: # type: ignore
+        elif fontStyle == 3:
             font.setStyle(QFont.StyleItalic)
-        elif self.fontStyle == 4: # type: ignore
+        elif fontStyle == 4:
             font.setWeight(QFont.Bold)
             font.setStyle(QFont.StyleItalic)
-        elif self.fontStyle == 5: # type: ignore
+        elif fontStyle == 5:
             font.setStyle(QFont.StyleOblique)
-        elif self.fontStyle == 6: # type: ignore
+        elif fontStyle == 6:
             font.setCapitalization(QFont.SmallCaps)
 
         image = FramePainter(width, height)
         x, y = self.getXY()
         log.debug('Text position translates to %s, %s', x, y)
-        if self.stroke > 0: # type: ignore
-            outliner = QtGui.QPainterPathStroker()
-            outliner.setWidth(self.stroke) # type: ignore
-            path = QtGui.QPainterPath()
-            if self.fontStyle == 6: # type: ignore
-                # PathStroker ignores smallcaps so we need this weird hack
-                path.addText(x, y, font, self.title[0]) # type: ignore
-                fm = QtGui.QFontMetrics(font)
-                newX = x + fm.width(self.title[0]) # type: ignore
-                strokeFont = self.page.fontComboBox_titleFont.currentFont()
-                strokeFont.setCapitalization(QFont.SmallCaps)
-                strokeFont.setPixelSize(int((self.fontSize / 7) * 5)) # type: ignore
-                strokeFont.setLetterSpacing(QFont.PercentageSpacing, 139) # type: ignore
-                path.addText(newX, y, strokeFont, self.title[1:]) # type: ignore
+        if strokeWidth > 0:
+            pathKey = (title, font.key(), strokeWidth, fontStyle, x, y)
+            if pathKey == self._strokedPathKey:
+                # same text/font/position: the stroked outline is
+                # identical, only the brush may differ
+                path = self._strokedPath
             else:
-                path.addText(x, y, font, self.title) # type: ignore
-            path = outliner.createStroke(path)
+                outliner = QtGui.QPainterPathStroker()
+                outliner.setWidth(strokeWidth)
+                path = QtGui.QPainterPath()
+                if fontStyle == 6:
+                    # PathStroker ignores smallcaps so we need this weird hack
+                    path.addText(x, y, font, title[0])
+                    _, firstWidth = self._fontMetrics(font, title[0])
+                    newX = x + firstWidth
+                    strokeFont = self.page.fontComboBox_titleFont.currentFont()
+                    strokeFont.setCapitalization(QFont.SmallCaps)
+                    strokeFont.setPixelSize(int((fontSize / 7) * 5))
+                    strokeFont.setLetterSpacing(QFont.PercentageSpacing, 139) # type: ignore
+                    path.addText(newX, y, strokeFont, title[1:])
+                else:
+                    path.addText(x, y, font, title)
+                path = outliner.createStroke(path)
+                self._strokedPath = path
+                self._strokedPathKey = pathKey
             image.setPen(QtCore.Qt.NoPen) # type: ignore
             image.setBrush(PaintColor(*self.strokeColor)) # type: ignore
             image.drawPath(path)
 
         image.setFont(font)
         image.setPen(self.textColor) # type: ignore
-        image.drawText(x, y, self.title) # type: ignore
+        image.drawText(x, y, title)
 
         # turn QImage into Pillow frame
         frame = image.finalize() # type: ignore
         if self.shadow: # type: ignore
-            shadImg = ImageEnhance.Contrast(frame).enhance(0.0)
-            shadImg = shadImg.filter(ImageFilter.GaussianBlur(self.shadBlur)) # type: ignore
-            shadImg = ImageChops.offset(shadImg, self.shadX, self.shadY) # type: ignore
-            shadImg.paste(frame, box=(0, 0), mask=frame)
-            frame = shadImg
+            frame = self._drawShadow(frame, renderKey)
 
+        self._renderCache = (renderKey, frame)
         return frame
 
+    def _drawShadow(self, frame: Any, renderKey: tuple) -> Any:
+        '''
+            Composite the text over its drop shadow. The blurred
+            silhouette is the expensive part and does not depend on the
+            shadow offsets, so it is kept until the text itself changes.
+        '''
+        # the render key minus shadX/shadY identifies the silhouette
+        maskKey = renderKey[:10] + renderKey[12:]
+        cache = self._shadowCache
+        if cache is not None and cache[0] == maskKey:
+            shadImg = cache[1]
+        else:
+            # A black layer under the text's blurred alpha channel;
+            # only the single-channel mask goes through the blur
+            alpha = frame.getchannel('A').filter(
+                ImageFilter.GaussianBlur(self.shadBlur)) # type: ignore
+            shadImg = Image.new('RGBA', frame.size, (0, 0, 0, 0))
+            shadImg.putalpha(alpha)
+            self._shadowCache = (maskKey, shadImg)
+
+        out = BlankFrame(*frame.size)
+        out.paste(shadImg, box=(self.shadX, self.shadY)) # type: ignore
+        out.paste(frame, box=(0, 0), mask=frame)
+        return out
+
     def commandHelp(self) -> None:
         print('Enter a string to use as centred white text:')
         print('    "title=User Error"')
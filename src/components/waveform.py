@@ -1,12 +1,13 @@
 from PIL import Image
 from PyQt5 import QtWidgets
+import numpy as np
 from PyQt5.QtGui import QColor
 import os
 import logging
 from typing import List, Dict, Any, Tuple, Optional
 
 from ..component import Component
-from ..toolkit.frame import BlankFrame, scale
+from ..toolkit.frame import scale
 from ..toolkit import checkOutput
 from ..toolkit.ffmpeg import (
     openPipe, closePipe, getAudioDuration, FfmpegVideo, exampleSound
@@ -22,7 +23,13 @@ class Component(Component):
 
     def widget(self, *args: Any) -> None:
         super().widget(*args)
-        self._image: Image.Image = BlankFrame(self.width, self.height)
+        # Last good frame as a raw RGBA array, and the reusable
+        # destination buffer frames are blitted into
+        self._image: np.ndarray = np.zeros(
+            (self.height, self.width, 4), dtype=np.uint8)
+        self._dst: Optional[np.ndarray] = None
+        # Rectangle written on the previous blit; only it needs wiping
+        self._lastBox: Optional[Tuple[int, int, int, int]] = None
 
         self.page.lineEdit_color.setText('255,255,255')
 
@@ -186,21 +193,47 @@ class Component(Component):
         self.chunkSize = 4 * width * height
 
     def finalizeFrame(self, imageData: bytes) -> QtGui.QImage:
+        width, height = scale(
+            self.scale, self.width, self.height, int) # type: ignore
+
         try:
-            image = Image.frombytes(
-                'RGBA',
-                scale(self.scale, self.width, self.height, int), # type: ignore
-                imageData
-            )
+            # view the raw FFmpeg chunk in place; no PIL decode pass
+            image = np.frombuffer(imageData, dtype=np.uint8).reshape(
+                height, width, 4)
             self._image = image
         except ValueError:
             # use last good frame
             image = self._image
 
-        if self.scale != 100 \
-                or self.x != 0 or self.y != 0: # type: ignore
-            frame = BlankFrame(self.width, self.height)
-            frame.paste(image, box=(self.x, self.y)) # type: ignore
-        else:
-            frame = image
-        return frame
\ No newline at end of file
+        if self.scale == 100 \
+                and self.x == 0 and self.y == 0: # type: ignore
+            return Image.fromarray(image, 'RGBA')
+        return Image.fromarray(self._blit(image), 'RGBA')
+
+    def _blit(self, image: np.ndarray) -> np.ndarray:
+        '''
+            Place the frame in the reusable destination buffer with one
+            sliced copy instead of allocating a BlankFrame and pasting.
+        '''
+        width, height = self.width, self.height
+        dst = self._dst
+        if dst is None or dst.shape[0] != height or dst.shape[1] != width:
+            dst = np.zeros((height, width, 4), dtype=np.uint8)
+            self._dst = dst
+            self._lastBox = None
+        x, y = self.x, self.y # type: ignore
+        imgHeight, imgWidth = image.shape[:2]
+        x0, y0 = max(x, 0), max(y, 0)
+        x1 = min(x + imgWidth, width)
+        y1 = min(y + imgHeight, height)
+        box = (x0, y0, x1, y1)
+        if box != self._lastBox:
+            # the paste box is constant within a render, so this wipe
+            # only ever runs when the position or scale was edited
+            last = self._lastBox
+            if last is not None:
+                dst[last[1]:last[3], last[0]:last[2]] = 0
+            self._lastBox = box
+        if x1 > x0 and y1 > y0:
+            dst[y0:y1, x0:x1] = image[y0 - y:y1 - y, x0 - x:x1 - x]
+        return dst
\ No newline at end of file
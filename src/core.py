@@ -38,6 +38,7 @@ class Core:
     junkStream: str
     encoderOptions: Dict[str, Any]
     resolutions: List[str]
+    parsedResolutions: List[Tuple[int, int]]
     logDir: str
     logEnabled: bool
     previewEnabled: bool
@@ -55,6 +56,8 @@ class Core:
         self.savedPresets: Dict[str, Dict[str, Any]] = {}  # copies of presets to detect modification
         self.openingProject: bool = False
         self.videoThread: Optional[QtCore.QThread] = None #to avoid type: ignore
+        # parseAvFile results keyed on path, valid while mtime is unchanged
+        self._avFileCache: Dict[str, Tuple[int, Tuple[int, Dict[str, Any]]]] = {}
 
     def __repr__(self) -> str:
         return "\n=~=~=~=\n".join(
@@ -293,6 +296,16 @@ class Core:
             Returns dictionary with section names as the keys, each one
             contains a list of tuples: (compName, version, compPresetDict)
         '''
+        try:
+            mtime = os.stat(filepath).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime is not None and filepath in self._avFileCache:
+            cachedMtime, cachedResult = self._avFileCache[filepath]
+            if cachedMtime == mtime:
+                log.debug('Using cached parse of av file: %s', filepath)
+                return cachedResult
+
         log.debug('Parsing av file: %s', filepath)
         validSections = (
                     'Components',
@@ -339,6 +352,8 @@ class Core:
                         key, value = line.split('=', 1)
                         data[section].append((key, value.strip()))
 
+            if mtime is not None:
+                self._avFileCache[filepath] = (mtime, (0, data))
             return 0, data
         except Exception:
             return 1, sys.exc_info()
@@ -477,6 +492,12 @@ class Core:
             'previewEnabled': True,
         }
 
+        # (width, height) int pairs so hot paths skip the "WxH" parse
+        settings['parsedResolutions'] = [
+            tuple(int(dim) for dim in res.split('x'))
+            for res in settings['resolutions']
+        ]
+
         settings['videoFormats'] = toolkit.appendUppercase([
             '*.mp4',
             '*.mov',
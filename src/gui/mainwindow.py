@@ -622,7 +622,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.settings.setValue('outputWidth', res[0])
         self.settings.setValue('outputHeight', res[1])
         if changed:
-            for i in range(len(self.core.selectedComponents):
+            for i, comp in enumerate(self.core.selectedComponents):
+                comp.invalidateSize()
                 self.core.updateComponent(i)
 
     def drawPreview(self, force: bool = False, **kwargs: Any) -> None:
@@ -1343,7 +1344,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.settings.setValue('outputWidth', res[0])
         self.settings.setValue('outputHeight', res[1])
         if changed:
-            for i in range(len(self.core.selectedComponents):
+            for i, comp in enumerate(self.core.selectedComponents):
+                comp.invalidateSize()
                 self.core.updateComponent(i)
 
     def drawPreview(self, force: bool = False, **kwargs: Any) -> None:
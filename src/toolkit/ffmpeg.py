@@ -56,8 +56,13 @@ class FfmpegVideo:
                 filter_.insert(0, '-filter_complex')
 
 
+        filterThreads = str(os.cpu_count() or 4)
         self.command: List[str] = [
             core.Core.FFMPEG_BIN,
+            '-threads', '0',
+            # filter graphs run single-threaded unless told otherwise
+            '-filter_threads', filterThreads,
+            '-filter_complex_threads', filterThreads,
             '-thread_queue_size', '512',
             '-r', str(self.frameRate),
             '-stream_loop', self.loopValue,
@@ -103,12 +108,12 @@ class FfmpegVideo:
             with open(logFilename, 'a') as logf:
                 self.pipe = openPipe(
                     self.command, stdin=sp.DEVNULL,
-                    stdout=sp.PIPE, stderr=logf, bufsize=10**8
+                    stdout=sp.PIPE, stderr=logf, bufsize=1 << 20
                 )
         else:
             self.pipe = openPipe(
                 self.command, stdin=sp.DEVNULL, stdout=sp.PIPE,
-                stderr=sp.DEVNULL, bufsize=10**8
+                stderr=sp.DEVNULL, bufsize=1 << 20
             )
 
         if not self.pipe:
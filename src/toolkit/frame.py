@@ -14,6 +14,17 @@ from .. import core
 
 log = logging.getLogger('AVP.Toolkit.Frame')
 
+# Pillow-SIMD is a drop-in replacement whose SSE4/AVX2 kernels speed up
+# the resize, blur, transpose and compositing calls used by the
+# components; its releases are versioned with a ".postN" suffix.
+_pilVersion = getattr(Image, '__version__', 'unknown')
+if '.post' in _pilVersion:
+    log.info('Pillow-SIMD %s in use', _pilVersion)
+else:
+    log.debug(
+        'Plain Pillow %s in use; pillow-simd would accelerate the '
+        'render pipeline', _pilVersion)
+
 
 class FramePainter(QtGui.QPainter):
     '''
@@ -82,10 +93,19 @@ def FloodFrame(width, height, RgbaTuple):
     return Image.new("RGBA", (width, height), RgbaTuple)
 
 
+# Transparent templates keyed by size; only a couple of sizes ever occur
+# (preview & output), and copying one is cheaper than flood-filling anew
+_blankTemplates = {}
+
+
 @defaultSize
 def BlankFrame(width, height):
     '''The base frame used by each component to start drawing.'''
-    return FloodFrame(width, height, (0, 0, 0, 0))
+    template = _blankTemplates.get((width, height))
+    if template is None:
+        template = FloodFrame(width, height, (0, 0, 0, 0))
+        _blankTemplates[(width, height)] = template
+    return template.copy()
 
 
 @defaultSize